@@ -411,15 +411,60 @@ def get_user_watchlist_vessel_ids(user_id: str) -> dict[str, dict[str, bool]]:
         .eq("user_id", user_id)
         .execute()
     )
+    return {row["vessel_id"]: _watchlist_flags(row) for row in (res.data or [])}
+
+
+# Max user ids per in_() filter: PostgREST sends the list in the GET query
+# string (~37 bytes per UUID), so large batches would exceed URL limits.
+USER_ID_CHUNK_SIZE = 200
+
+
+def _user_id_chunks(user_ids) -> list[list[str]]:
+    ids = list(user_ids)
+    return [ids[i:i + USER_ID_CHUNK_SIZE] for i in range(0, len(ids), USER_ID_CHUNK_SIZE)]
+
+
+# PostgREST silently truncates responses at max_rows (1000 by default)
+ROW_PAGE_SIZE = 1000
+
+
+def _fetch_all_rows(build_query) -> list[dict]:
+    """Page through ``build_query()`` ordered by id until a page comes back short."""
+    rows: list[dict] = []
+    start = 0
+    while True:
+        page = (build_query().order("id").range(start, start + ROW_PAGE_SIZE - 1).execute()).data or []
+        rows.extend(page)
+        if len(page) < ROW_PAGE_SIZE:
+            return rows
+        start += ROW_PAGE_SIZE
+
+
+def _watchlist_flags(row: dict) -> dict[str, bool]:
     return {
-        row["vessel_id"]: {
-            "notify_price_change": row.get("notify_price_change", True),
-            "notify_status_change": row.get("notify_status_change", True),
-        }
-        for row in (res.data or [])
+        "notify_price_change": row.get("notify_price_change", True),
+        "notify_status_change": row.get("notify_status_change", True),
     }
 
 
+def get_watchlists_for_users(user_ids: list[str]) -> dict[str, dict[str, dict[str, bool]]]:
+    """Get watchlist entries for many users, paging each USER_ID_CHUNK_SIZE-id chunk.
+
+    Returns user_id -> vessel_id -> notification flags, with an empty dict
+    for users without watchlist entries.
+    """
+    watchlists: dict[str, dict[str, dict[str, bool]]] = {user_id: {} for user_id in user_ids}
+    for chunk in _user_id_chunks(watchlists):
+        rows = _fetch_all_rows(
+            lambda: supabase.table("watchlist")
+            .select("user_id, vessel_id, notify_price_change, notify_status_change")
+            .in_("user_id", chunk)
+        )
+        for row in rows:
+            watchlists.setdefault(row["user_id"], {})[row["vessel_id"]] = _watchlist_flags(row)
+    return watchlists
+
+
 def save_notification_history(
     user_id: str,
     vessel_ids: list,
@@ -468,6 +513,25 @@ def get_user_saved_searches(user_id: str, frequency: str | None = None) -> list[
     return (query.execute()).data or []
 
 
+def get_saved_searches_for_users(user_ids: list[str], frequency: str | None = None) -> dict[str, list[dict]]:
+    """Get active saved searches for many users, keyed by user_id.
+
+    Pages through each chunk of USER_ID_CHUNK_SIZE ids.
+    """
+    searches: dict[str, list[dict]] = {user_id: [] for user_id in user_ids}
+    for chunk in _user_id_chunks(searches):
+
+        def build_query():
+            query = supabase.table("saved_searches").select("*").in_("user_id", chunk).eq("active", True)
+            if frequency:
+                query = query.eq("frequency", frequency)
+            return query
+
+        for row in _fetch_all_rows(build_query):
+            searches.setdefault(row["user_id"], []).append(row)
+    return searches
+
+
 def get_changes_since(cutoff_iso: str) -> list[dict]:
     """Get vessel changes since a given ISO timestamp.
 
@@ -4,7 +4,9 @@ Sends alerts to subscribers when the scraper detects vessel changes
 (new listings, price changes). Called from main.py after scraping.
 """
 
+import functools
 import logging
+import operator
 import os
 from datetime import datetime, timezone
 from html import escape
@@ -336,45 +338,39 @@ def build_personalized_subject(user_changes: list[dict]) -> str:
     return f"Navisio: {summary} in uw meldingen"
 
 
-def _build_change_sections(changes: list[dict]) -> str:
-    """Build grouped HTML sections for price changes, new vessels, and removed vessels."""
-    price_changes = [c for c in changes if c["kind"] == "price_changed"]
-    new_vessels = [c for c in changes if c["kind"] == "inserted"]
-    removed_vessels = [c for c in changes if c["kind"] in ("removed", "sold")]
-
-    sections = ""
+# Email sections in display order: (heading, heading colour, change kinds)
+_CHANGE_SECTIONS = (
+    ("Prijswijzigingen", "#d97706", ("price_changed",)),
+    ("Nieuwe schepen", "#059669", ("inserted",)),
+    ("Verkocht / Verwijderd", "#ef4444", ("removed", "sold")),
+)
+_SECTION_INDEX_BY_KIND = {
+    kind: index for index, (_, _, kinds) in enumerate(_CHANGE_SECTIONS) for kind in kinds
+}
 
-    if price_changes:
-        rows = "\n".join(_build_vessel_row(c) for c in price_changes)
-        sections += f"""
-        <div style="margin-bottom:16px;">
-          <h3 style="margin:0 0 8px;color:#d97706;font-size:14px;text-transform:uppercase;">
-            Prijswijzigingen ({len(price_changes)})
-          </h3>
-          <table style="width:100%;border-collapse:collapse;">{rows}</table>
-        </div>"""
 
-    if new_vessels:
-        rows = "\n".join(_build_vessel_row(c) for c in new_vessels)
-        sections += f"""
-        <div style="margin-bottom:16px;">
-          <h3 style="margin:0 0 8px;color:#059669;font-size:14px;text-transform:uppercase;">
-            Nieuwe schepen ({len(new_vessels)})
-          </h3>
-          <table style="width:100%;border-collapse:collapse;">{rows}</table>
-        </div>"""
+def _build_change_sections(changes: list[dict]) -> str:
+    """Build grouped HTML sections for price changes, new vessels, and removed vessels."""
+    section_rows: list[list[str]] = [[] for _ in _CHANGE_SECTIONS]
+    for c in changes:
+        index = _SECTION_INDEX_BY_KIND.get(c["kind"])
+        if index is not None:
+            section_rows[index].append(_build_vessel_row(c))
 
-    if removed_vessels:
-        rows = "\n".join(_build_vessel_row(c) for c in removed_vessels)
-        sections += f"""
+    parts = []
+    for (heading, color, _), rows in zip(_CHANGE_SECTIONS, section_rows):
+        if not rows:
+            continue
+        table_rows = "\n".join(rows)
+        parts.append(f"""
         <div style="margin-bottom:16px;">
-          <h3 style="margin:0 0 8px;color:#ef4444;font-size:14px;text-transform:uppercase;">
-            Verkocht / Verwijderd ({len(removed_vessels)})
+          <h3 style="margin:0 0 8px;color:{color};font-size:14px;text-transform:uppercase;">
+            {heading} ({len(rows)})
           </h3>
-          <table style="width:100%;border-collapse:collapse;">{rows}</table>
-        </div>"""
+          <table style="width:100%;border-collapse:collapse;">{table_rows}</table>
+        </div>""")
 
-    return sections
+    return "".join(parts)
 
 
 def build_personalized_email(subscriber: dict, user_changes: list[dict]) -> str:
@@ -509,6 +505,7 @@ def send_personalized_notifications(stats: dict, changes: list[dict]) -> dict:
 
     personalized_subs = [s for s in subscribers if s.get("user_id")]
     legacy_subs = [s for s in subscribers if not s.get("user_id")]
+    search_match_cache: dict = {}
 
     # Personalized emails for subscribers with user accounts
     for sub in personalized_subs:
@@ -519,7 +516,7 @@ def send_personalized_notifications(stats: dict, changes: list[dict]) -> dict:
             if c.get("vessel", {}).get("id")
         }
         saved_search_changes = _get_saved_search_matches_deduped(
-            sub["user_id"], "immediate", changes, seen_vessel_ids
+            sub["user_id"], "immediate", changes, seen_vessel_ids, search_match_cache
         )
         user_changes = watchlist_changes + saved_search_changes
         if not user_changes:
@@ -593,62 +590,94 @@ def send_personalized_notifications(stats: dict, changes: list[dict]) -> dict:
     return report
 
 
-def get_saved_search_matches(search: dict, all_changes: list[dict]) -> list[dict]:
-    """Filter changes matching saved search criteria."""
-    filters = search.get("filters") or {}
-    matches = list(all_changes)
+# Saved-search range filters: (filter key, vessel field, cast, value used
+# when the vessel field is empty, comparison against the filter bound)
+_RANGE_FILTERS = (
+    ("minPrice", "price", float, 0, operator.ge),
+    ("maxPrice", "price", float, float("inf"), operator.le),
+    ("minLength", "length_m", float, 0, operator.ge),
+    ("maxLength", "length_m", float, float("inf"), operator.le),
+    ("minWidth", "width_m", float, 0, operator.ge),
+    ("maxWidth", "width_m", float, float("inf"), operator.le),
+    ("minBuildYear", "build_year", int, 0, operator.ge),
+    ("maxBuildYear", "build_year", int, 9999, operator.le),
+    ("minTonnage", "tonnage", float, 0, operator.ge),
+    ("maxTonnage", "tonnage", float, float("inf"), operator.le),
+)
 
-    if filters.get("search"):
-        q = filters["search"].lower()
-        matches = [c for c in matches if q in c.get("vessel", {}).get("name", "").lower()]
+
+def _range_predicate(field: str, default, compare, bound):
+    return lambda vessel: compare(vessel.get(field) or default, bound)
+
+
+def _saved_search_predicates(filters: dict) -> list:
+    """Turn saved-search filters into a list of per-vessel predicates.
+
+    Only active filters produce a predicate, and their constants (lowered
+    search term, numeric bounds) are converted once here rather than per
+    vessel. Equality checks come first and the substring search last, since
+    evaluation stops at the first failing predicate.
+    """
+    predicates = []
 
     if filters.get("type"):
-        matches = [c for c in matches if c.get("vessel", {}).get("type") == filters["type"]]
+        vessel_type = filters["type"]
+        predicates.append(lambda vessel: vessel.get("type") == vessel_type)
 
     if filters.get("source"):
-        matches = [c for c in matches if c.get("vessel", {}).get("source") == filters["source"]]
+        source = filters["source"]
+        predicates.append(lambda vessel: vessel.get("source") == source)
+
+    for key, field, cast, default, compare in _RANGE_FILTERS:
+        if filters.get(key):
+            predicates.append(_range_predicate(field, default, compare, cast(filters[key])))
 
-    if filters.get("minPrice"):
-        min_price = float(filters["minPrice"])
-        matches = [c for c in matches if (c.get("vessel", {}).get("price") or 0) >= min_price]
+    if filters.get("search"):
+        q = filters["search"].lower()
+        predicates.append(lambda vessel: q in vessel.get("name", "").lower())
 
-    if filters.get("maxPrice"):
-        max_price = float(filters["maxPrice"])
-        matches = [c for c in matches if (c.get("vessel", {}).get("price") or float("inf")) <= max_price]
+    return predicates
 
-    if filters.get("minLength"):
-        min_len = float(filters["minLength"])
-        matches = [c for c in matches if (c.get("vessel", {}).get("length_m") or 0) >= min_len]
 
-    if filters.get("maxLength"):
-        max_len = float(filters["maxLength"])
-        matches = [c for c in matches if (c.get("vessel", {}).get("length_m") or float("inf")) <= max_len]
+@functools.lru_cache(maxsize=256)
+def _cached_saved_search_predicates(filter_items: tuple) -> tuple:
+    return tuple(_saved_search_predicates(dict(filter_items)))
 
-    if filters.get("minWidth"):
-        min_w = float(filters["minWidth"])
-        matches = [c for c in matches if (c.get("vessel", {}).get("width_m") or 0) >= min_w]
 
-    if filters.get("maxWidth"):
-        max_w = float(filters["maxWidth"])
-        matches = [c for c in matches if (c.get("vessel", {}).get("width_m") or float("inf")) <= max_w]
+def _saved_search_key(filters: dict) -> tuple | None:
+    """Hashable identity of a filter dict, or None if a value is unhashable."""
+    try:
+        key = tuple(sorted(filters.items()))
+        hash(key)
+    except TypeError:
+        return None
+    return key
 
-    if filters.get("minBuildYear"):
-        min_by = int(filters["minBuildYear"])
-        matches = [c for c in matches if (c.get("vessel", {}).get("build_year") or 0) >= min_by]
 
-    if filters.get("maxBuildYear"):
-        max_by = int(filters["maxBuildYear"])
-        matches = [c for c in matches if (c.get("vessel", {}).get("build_year") or 9999) <= max_by]
+def _compile_saved_search(filters: dict):
+    """Predicates for ``filters``, memoized on the filter contents.
 
-    if filters.get("minTonnage"):
-        min_t = float(filters["minTonnage"])
-        matches = [c for c in matches if (c.get("vessel", {}).get("tonnage") or 0) >= min_t]
+    Many subscribers save the same searches, so identical filter dicts share
+    one compiled predicate tuple. Filters with unhashable values are
+    compiled uncached.
+    """
+    key = _saved_search_key(filters)
+    if key is None:
+        return _saved_search_predicates(filters)
+    return _cached_saved_search_predicates(key)
 
-    if filters.get("maxTonnage"):
-        max_t = float(filters["maxTonnage"])
-        matches = [c for c in matches if (c.get("vessel", {}).get("tonnage") or float("inf")) <= max_t]
 
-    return matches
+def get_saved_search_matches(search: dict, all_changes: list[dict]) -> list[dict]:
+    """Filter changes matching saved search criteria.
+
+    All filters are checked in a single pass over the changes; a change is
+    rejected at its first failing predicate.
+    """
+    predicates = _compile_saved_search(search.get("filters") or {})
+    return [
+        c for c in all_changes
+        if all(predicate(c.get("vessel", {})) for predicate in predicates)
+    ]
 
 
 def build_digest_email(subscriber: dict, all_matches: list[dict], label: str) -> str:
@@ -693,9 +722,15 @@ def build_digest_email(subscriber: dict, all_matches: list[dict], label: str) ->
 
 def _get_watchlist_matches(
     user_id: str, changes: list[dict], seen_vessel_ids: set[str],
+    watchlist: dict[str, dict[str, bool]] | None = None,
 ) -> list[dict]:
-    """Filter changes to vessels on the user's watchlist, respecting per-vessel flags."""
-    watchlist = get_user_watchlist_vessel_ids(user_id)
+    """Filter changes to vessels on the user's watchlist, respecting per-vessel flags.
+
+    Pass ``watchlist`` when it was already loaded in bulk; otherwise it is
+    fetched for ``user_id``.
+    """
+    if watchlist is None:
+        watchlist = get_user_watchlist_vessel_ids(user_id)
     matches = []
     for change in changes:
         vid = change.get("vessel", {}).get("id")
@@ -711,15 +746,33 @@ def _get_watchlist_matches(
 
 
 def _get_saved_search_matches_deduped(
-    user_id: str, frequency: str, changes: list[dict], seen_vessel_ids: set[str],
+    user_id: str,
+    frequency: str,
+    changes: list[dict],
+    seen_vessel_ids: set[str],
+    match_cache: dict | None = None,
+    searches: list[dict] | None = None,
 ) -> list[dict]:
-    """Filter changes matching saved search criteria, deduplicating against already-seen vessels."""
-    from db import get_user_saved_searches
+    """Filter changes matching saved search criteria, deduplicating against already-seen vessels.
+
+    ``match_cache`` maps filter keys to their matches over ``changes``; pass
+    one dict for a whole dispatch run so a search shared by many subscribers
+    is evaluated once. ``searches`` skips the per-user lookup when the
+    saved searches were already loaded in bulk.
+    """
+    if searches is None:
+        from db import get_user_saved_searches
 
-    searches = get_user_saved_searches(user_id, frequency=frequency)
+        searches = get_user_saved_searches(user_id, frequency=frequency)
     matches = []
     for search in searches:
-        search_matches = get_saved_search_matches(search, changes)
+        key = _saved_search_key(search.get("filters") or {}) if match_cache is not None else None
+        if key is None:
+            search_matches = get_saved_search_matches(search, changes)
+        elif key in match_cache:
+            search_matches = match_cache[key]
+        else:
+            search_matches = match_cache[key] = get_saved_search_matches(search, changes)
         for match in search_matches:
             vid = match.get("vessel", {}).get("id")
             if vid not in seen_vessel_ids:
@@ -737,7 +790,13 @@ def send_digest(frequency: str) -> None:
         logger.warning("RESEND_API_KEY niet ingesteld, digest overgeslagen.")
         return
 
-    from db import get_subscribers_with_frequency, get_changes_since, save_notification_history
+    from db import (
+        get_changes_since,
+        get_saved_searches_for_users,
+        get_subscribers_with_frequency,
+        get_watchlists_for_users,
+        save_notification_history,
+    )
     from datetime import timedelta
 
     cutoff_days = 1 if frequency == "daily" else 7
@@ -753,10 +812,22 @@ def send_digest(frequency: str) -> None:
         logger.info("Geen abonnees voor %s digest.", frequency)
         return
 
+    # Two queries for the whole batch instead of two per subscriber
+    user_ids = [sub["user_id"] for sub in subscribers]
+    watchlists = get_watchlists_for_users(user_ids)
+    saved_searches = get_saved_searches_for_users(user_ids, frequency=frequency)
+
+    search_match_cache: dict = {}
     for sub in subscribers:
+        user_id = sub["user_id"]
         seen_vessel_ids: set[str] = set()
-        watchlist_matches = _get_watchlist_matches(sub["user_id"], recent_changes, seen_vessel_ids)
-        search_matches = _get_saved_search_matches_deduped(sub["user_id"], frequency, recent_changes, seen_vessel_ids)
+        watchlist_matches = _get_watchlist_matches(
+            user_id, recent_changes, seen_vessel_ids, watchlists.get(user_id, {})
+        )
+        search_matches = _get_saved_search_matches_deduped(
+            user_id, frequency, recent_changes, seen_vessel_ids, search_match_cache,
+            saved_searches.get(user_id, []),
+        )
         user_matches = watchlist_matches + search_matches
 
         if not user_matches:
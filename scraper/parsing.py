@@ -17,7 +17,8 @@ def parse_price(text: str | None) -> float | None:
     if not text:
         return None
     text = text.strip()
-    if any(phrase in text.lower() for phrase in SKIP_PHRASES):
+    lowered = text.lower()
+    if any(phrase in lowered for phrase in SKIP_PHRASES):
         return None
     cleaned = (
         text.replace("€", "").replace("EUR", "").replace(" ", "")
@@ -31,11 +32,34 @@ def parse_price(text: str | None) -> float | None:
         return None
 
 
+_DIMENSIONS_RE = re.compile(r"([\d.,]+)\s*m?\s*x\s*([\d.,]+)")
+_NUMBER_CHARS = "0123456789.,"
+
+
+def _plain_dimension(part: str) -> str | None:
+    """Return the bare number in '110.00', ' 11,45 m' or '8.21m', else None."""
+    part = part.strip().removesuffix("m").rstrip()
+    if part and not part.strip(_NUMBER_CHARS):
+        return part
+    return None
+
+
 def parse_dimensions(text: str | None) -> tuple[float | None, float | None]:
     """Parse dimensions like '100,00 m x 11,40 m' to (length, width)."""
     if not text:
         return None, None
-    match = re.search(r"([\d.,]+)\s*m?\s*x\s*([\d.,]+)", text)
+    # Fast path: nearly every listing is just "<length> x <width>", which a
+    # single split handles without the regex engine.
+    left, sep, right = text.partition("x")
+    if sep:
+        length_raw = _plain_dimension(left)
+        width_raw = _plain_dimension(right)
+        if length_raw and width_raw:
+            try:
+                return float(length_raw.replace(",", ".")), float(width_raw.replace(",", "."))
+            except ValueError:
+                return None, None
+    match = _DIMENSIONS_RE.search(text)
     if not match:
         return None, None
     try:
@@ -46,11 +70,14 @@ def parse_dimensions(text: str | None) -> tuple[float | None, float | None]:
         return None, None
 
 
+_BUILD_YEAR_RE = re.compile(r"(\d{4})")
+
+
 def parse_build_year(text: str | None) -> int | None:
     """Parse build year from text like 'Bouwjaar 1973' to int."""
     if not text:
         return None
-    match = re.search(r"(\d{4})", text)
+    match = _BUILD_YEAR_RE.search(text)
     return int(match.group(1)) if match else None
 
 
@@ -71,6 +98,9 @@ def parse_dimension_value(value) -> float | None:
     """Parse a single dimension like '110,00m' or 110.0 to float."""
     if value is None:
         return None
+    # API payloads usually carry plain numbers; bool is excluded as before
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
     s = str(value).strip().lower().replace("m", "").replace(",", ".").strip()
     if not s:
         return None
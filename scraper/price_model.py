@@ -7,9 +7,11 @@ neighbor distance and price coefficient of variation.
 Predictions are stored directly in the vessels DB table.
 """
 
+import heapq
 import logging
 import math
 from datetime import datetime, timezone
+from operator import itemgetter
 
 from db import supabase
 
@@ -37,16 +39,32 @@ RANGE_MARGINS = {"high": 0.15, "medium": 0.25, "low": 0.35}
 
 K = 3  # Number of neighbors
 
+# FEATURE_CONFIG flattened to (feature, divisor, weight) triples so the
+# distance loop, which runs once per fleet vessel per target, does no
+# nested dict lookups
+_FEATURES = tuple((feat, cfg["divisor"], cfg["weight"]) for feat, cfg in FEATURE_CONFIG.items())
 
-def _get_features(vessel: dict) -> dict | None:
-    """Extract the 6D feature vector from a vessel. Returns None if missing core features."""
+_by_distance = itemgetter(0)
+
+
+def _get_features(vessel: dict, current_year: int | None = None) -> dict | None:
+    """Extract the 6D feature vector from a vessel. Returns None if missing core features.
+
+    Pass ``current_year`` when featurizing a whole fleet so the clock is read
+    once per run rather than once per vessel.
+    """
     length = vessel.get("length_m")
     width = vessel.get("width_m")
     if length is None or width is None:
         return None
 
     build_year = vessel.get("build_year")
-    age = (datetime.now(timezone.utc).year - build_year) if build_year else None
+    if build_year:
+        if current_year is None:
+            current_year = datetime.now(timezone.utc).year
+        age = current_year - build_year
+    else:
+        age = None
 
     signals = vessel.get("condition_signals") or {}
     engine_hp = signals.get("engine_hp")
@@ -69,13 +87,15 @@ def _compute_distance(a: dict, b: dict) -> float:
     """
     total = 0.0
     dims = 0
-    for feat, cfg in FEATURE_CONFIG.items():
+    for feat, divisor, weight in _FEATURES:
         va = a.get(feat)
+        if va is None:
+            continue
         vb = b.get(feat)
-        if va is None or vb is None:
+        if vb is None:
             continue
-        diff = (va - vb) / cfg["divisor"]
-        total += cfg["weight"] * diff * diff
+        diff = (va - vb) / divisor
+        total += weight * diff * diff
         dims += 1
 
     if dims < 2:
@@ -96,35 +116,30 @@ def _knn_predict(
     target_type = target.get("type")
     target_id = target.get("id")
 
-    # Compute distances to all candidates
-    candidates = []
+    # Compute distances to all candidates, bucketed by type match
+    same_type_candidates = []
+    cross_type_candidates = []
     for vessel, features in fleet:
         if vessel.get("id") == target_id:
             continue
         if vessel.get("price") is None or vessel["price"] <= 0:
             continue
 
-        # Prefer same-type, but allow cross-type fallback
-        same_type = vessel.get("type") == target_type if target_type else False
         dist = _compute_distance(target_features, features)
         if dist == float("inf"):
             continue
 
-        candidates.append((dist, same_type, vessel))
-
-    # Sort: same-type first, then by distance
-    candidates.sort(key=lambda x: (not x[1], x[0]))
-
-    # Take K neighbors (prefer same-type)
-    same_type_candidates = [(d, v) for d, st, v in candidates if st]
-    cross_type_candidates = [(d, v) for d, st, v in candidates if not st]
-
-    neighbors = []
-    for d, v in same_type_candidates[:K]:
-        neighbors.append((d, v))
+        # Prefer same-type, but allow cross-type fallback
+        if target_type and vessel.get("type") == target_type:
+            same_type_candidates.append((dist, vessel))
+        else:
+            cross_type_candidates.append((dist, vessel))
+
+    # Take K nearest neighbors (prefer same-type).  nsmallest is a bounded
+    # heap selection, stable on ties like the sort it replaces.
+    neighbors = heapq.nsmallest(K, same_type_candidates, key=_by_distance)
     if len(neighbors) < K:
-        for d, v in cross_type_candidates[: K - len(neighbors)]:
-            neighbors.append((d, v))
+        neighbors += heapq.nsmallest(K - len(neighbors), cross_type_candidates, key=_by_distance)
 
     if not neighbors:
         return None
@@ -218,12 +233,20 @@ def predict_all(vessels: list[dict], target_ids: list[str] | None = None) -> dic
     target_id_set = None if target_ids is None else {str(v) for v in target_ids if str(v).strip()}
 
     # Build feature vectors for the whole fleet
+    current_year = datetime.now(timezone.utc).year
     fleet: list[tuple[dict, dict]] = []
     for v in vessels:
-        features = _get_features(v)
+        features = _get_features(v, current_year)
         if features is not None:
             fleet.append((v, features))
 
+    # Only priced vessels can be neighbours; filter them once instead of
+    # re-checking every vessel inside each per-target KNN scan
+    priced_fleet = [
+        (v, features) for v, features in fleet
+        if v.get("price") is not None and v["price"] > 0
+    ]
+
     logger.info(
         "Price model: %d vessels with features out of %d total%s",
         len(fleet),
@@ -241,7 +264,7 @@ def predict_all(vessels: list[dict], target_ids: list[str] | None = None) -> dic
             continue
 
         try:
-            result = _knn_predict(vessel, features, fleet)
+            result = _knn_predict(vessel, features, priced_fleet)
 
             if result is None:
                 # Clear any stale prediction
@@ -9,6 +9,7 @@ tokens/minute — this limiter keeps usage under a configurable budget
 import logging
 import threading
 import time
+from collections import deque
 
 logger = logging.getLogger(__name__)
 
@@ -21,13 +22,17 @@ class TokenRateLimiter:
 
     def __init__(self, tokens_per_minute: int = 9000):
         self._budget = tokens_per_minute
-        self._window: list[tuple[float, int]] = []  # (timestamp, token_count)
+        # (timestamp, token_count), appended in monotonic order so the oldest
+        # entries are always at the left end
+        self._window: deque[tuple[float, int]] = deque()
         self._lock = threading.Lock()
 
     def _prune(self, now: float) -> None:
         """Remove entries older than 60 seconds."""
         cutoff = now - 60.0
-        self._window = [(t, n) for t, n in self._window if t > cutoff]
+        window = self._window
+        while window and window[0][0] <= cutoff:
+            window.popleft()
 
     def _current_usage(self, now: float) -> int:
         """Sum of tokens in the current 60-second window."""
@@ -64,7 +69,6 @@ class TokenRateLimiter:
     def record(self, output_tokens: int, estimated_tokens: int) -> None:
         """Replace the last estimate with actual output token count."""
         with self._lock:
-            now = time.monotonic()
             # Remove the most recent entry matching our estimate
             for i in range(len(self._window) - 1, -1, -1):
                 if self._window[i][1] == estimated_tokens:
@@ -9,6 +9,7 @@ import platform
 import socket
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -22,6 +23,7 @@ logger = logging.getLogger(__name__)
 EVIDENCE_FORMAT_VERSION = "1.0"
 DEFAULT_TIMEOUT_SECONDS = 30
 DEFAULT_USER_AGENT = "Navisio-Robots-Evidence/1.0 (+https://navisio.nl)"
+MAX_FETCH_WORKERS = 8
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_OUTPUT_ROOT = REPO_ROOT / "analysis" / "compliance" / "robots_evidence"
 
@@ -96,11 +98,8 @@ def _sha256_bytes(data: bytes) -> str:
 
 
 def _sha256_file(path: Path) -> str:
-    digest = hashlib.sha256()
     with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(65536), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+        return hashlib.file_digest(handle, "sha256").hexdigest()
 
 
 def _canonical_json_bytes(payload: dict[str, Any]) -> bytes:
@@ -195,12 +194,13 @@ def _robots_permissions(
     return permissions
 
 
-def _fetch_target(
-    target: RobotsTarget,
+def _fetch_robots(
+    url: str,
     timeout_seconds: int,
     user_agent: str,
     http_get: Callable[..., requests.Response],
 ) -> dict[str, Any]:
+    """GET one robots.txt and capture the raw response or transport error."""
     started_at = _iso_utc_now()
     request_headers = {
         "User-Agent": user_agent,
@@ -209,19 +209,15 @@ def _fetch_target(
 
     try:
         response = http_get(
-            target.robots_url,
+            url,
             headers=request_headers,
             timeout=timeout_seconds,
             allow_redirects=True,
         )
         body = response.content
-        status_code = int(response.status_code)
-        result = {
-            "source_key": target.source_key,
-            "host": target.host,
-            "requested_url": target.robots_url,
+        return {
             "final_url": str(response.url),
-            "status_code": status_code,
+            "status_code": int(response.status_code),
             "reason": str(response.reason or ""),
             "response_headers": _normalize_headers(response),
             "body_bytes": body,
@@ -229,15 +225,9 @@ def _fetch_target(
             "error": None,
             "fetched_at_utc": started_at,
             "completed_at_utc": _iso_utc_now(),
-            "relevant_paths": list(target.relevant_paths),
-            "robots_permissions": _robots_permissions(body, target.relevant_paths, user_agent, status_code),
         }
-        return result
     except requests.RequestException as exc:
         return {
-            "source_key": target.source_key,
-            "host": target.host,
-            "requested_url": target.robots_url,
             "final_url": None,
             "status_code": None,
             "reason": None,
@@ -247,13 +237,32 @@ def _fetch_target(
             "error": f"{exc.__class__.__name__}: {exc}",
             "fetched_at_utc": started_at,
             "completed_at_utc": _iso_utc_now(),
-            "relevant_paths": list(target.relevant_paths),
-            "robots_permissions": {path: None for path in target.relevant_paths},
         }
 
 
-def _write_json(path: Path, payload: dict[str, Any]) -> None:
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=True) + "\n", encoding="utf-8")
+def _target_result(target: RobotsTarget, fetched: dict[str, Any], user_agent: str) -> dict[str, Any]:
+    """Combine a fetched robots.txt with the target it is evidence for."""
+    if fetched["error"]:
+        permissions = {path: None for path in target.relevant_paths}
+    else:
+        permissions = _robots_permissions(
+            fetched["body_bytes"], target.relevant_paths, user_agent, fetched["status_code"]
+        )
+    return {
+        "source_key": target.source_key,
+        "host": target.host,
+        "requested_url": target.robots_url,
+        **fetched,
+        "relevant_paths": list(target.relevant_paths),
+        "robots_permissions": permissions,
+    }
+
+
+def _write_json(path: Path, payload: dict[str, Any]) -> str:
+    """Write *payload* as pretty JSON and return the SHA-256 of the bytes written."""
+    data = (json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=True) + "\n").encode("utf-8")
+    path.write_bytes(data)
+    return _sha256_bytes(data)
 
 
 def _openssl_available() -> bool:
@@ -361,7 +370,9 @@ def _timestamp_manifest(
     }
 
 
-def _write_sha256_sums(bundle_dir: Path) -> Path:
+def _write_sha256_sums(bundle_dir: Path, known_digests: dict[str, str] | None = None) -> Path:
+    """Write SHA256SUMS.txt; files listed in *known_digests* (by relative path) are not re-read."""
+    known_digests = known_digests or {}
     checksum_path = bundle_dir / "SHA256SUMS.txt"
     files = sorted(
         [path for path in bundle_dir.rglob("*") if path.is_file() and path.name != checksum_path.name],
@@ -369,8 +380,8 @@ def _write_sha256_sums(bundle_dir: Path) -> Path:
     )
     lines = []
     for path in files:
-        digest = _sha256_file(path)
         rel = path.relative_to(bundle_dir).as_posix()
+        digest = known_digests.get(rel) or _sha256_file(path)
         lines.append(f"{digest}  {rel}")
     checksum_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
     return checksum_path
@@ -402,9 +413,10 @@ def _update_chain_ledger(
         "previous_manifest_sha256": previous_manifest_sha256,
         "bundle_path": bundle_dir.relative_to(output_root).as_posix(),
     }
-    with ledger_path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(ledger_record, sort_keys=True, ensure_ascii=True))
-        handle.write("\n")
+    # One write per record: with O_APPEND the line lands whole even if runs overlap
+    ledger_line = json.dumps(ledger_record, sort_keys=True, ensure_ascii=True) + "\n"
+    with ledger_path.open("ab") as handle:
+        handle.write(ledger_line.encode("utf-8"))
 
     (chain_dir / "latest_manifest_sha256.txt").write_text(f"{manifest_sha256}\n", encoding="utf-8")
 
@@ -511,15 +523,29 @@ def run_capture(
 
     logger.info("Capturing robots evidence for %d target host(s)", len(targets))
     results: list[dict[str, Any]] = []
+    # Digests of files this run wrote from in-memory bytes, keyed by bundle path
+    known_digests: dict[str, str] = {}
+
+    # Fetch every distinct robots.txt URL concurrently (targets sharing a URL
+    # reuse one fetch); results are then emitted in target order.
+    robots_urls = list(dict.fromkeys(target.robots_url for target in targets))
+    logger.info("Fetching %s", ", ".join(robots_urls))
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_FETCH_WORKERS, len(robots_urls)),
+        thread_name_prefix="robots-fetch",
+    ) as executor:
+        fetched_by_url = dict(
+            zip(
+                robots_urls,
+                executor.map(
+                    lambda url: _fetch_robots(url, timeout_seconds, user_agent, http_get),
+                    robots_urls,
+                ),
+            )
+        )
 
     for target in targets:
-        logger.info("Fetching %s", target.robots_url)
-        fetched = _fetch_target(
-            target=target,
-            timeout_seconds=timeout_seconds,
-            user_agent=user_agent,
-            http_get=http_get,
-        )
+        fetched = _target_result(target, fetched_by_url[target.robots_url], user_agent)
 
         stem = _safe_file_stem(target)
         body_file_rel: str | None = None
@@ -529,6 +555,7 @@ def run_capture(
             body_path = responses_dir / f"{stem}.robots.txt"
             body_path.write_bytes(fetched["body_bytes"])
             body_file_rel = body_path.relative_to(bundle_dir).as_posix()
+            known_digests[body_file_rel] = body_sha256
 
         metadata_payload = {
             "source_key": fetched["source_key"],
@@ -545,12 +572,14 @@ def run_capture(
             "robots_permissions": fetched["robots_permissions"],
         }
         metadata_path = responses_dir / f"{stem}.metadata.json"
-        _write_json(metadata_path, metadata_payload)
+        metadata_sha256 = _write_json(metadata_path, metadata_payload)
+        metadata_file_rel = metadata_path.relative_to(bundle_dir).as_posix()
+        known_digests[metadata_file_rel] = metadata_sha256
 
         fetched["body_file"] = body_file_rel
         fetched["body_sha256"] = body_sha256
-        fetched["metadata_file"] = metadata_path.relative_to(bundle_dir).as_posix()
-        fetched["metadata_sha256"] = _sha256_file(metadata_path)
+        fetched["metadata_file"] = metadata_file_rel
+        fetched["metadata_sha256"] = metadata_sha256
         results.append(fetched)
 
     chain_dir = output_root / "chain"
@@ -572,9 +601,10 @@ def run_capture(
     canonical_manifest_path.write_bytes(canonical_manifest_bytes)
 
     manifest_path = bundle_dir / "manifest.json"
-    _write_json(manifest_path, manifest)
+    known_digests[manifest_path.name] = _write_json(manifest_path, manifest)
 
     manifest_sha256 = _sha256_bytes(canonical_manifest_bytes)
+    known_digests[canonical_manifest_path.name] = manifest_sha256
     manifest_sha_path = bundle_dir / "manifest.sha256"
     manifest_sha_path.write_text(f"{manifest_sha256}  {canonical_manifest_path.name}\n", encoding="utf-8")
 
@@ -611,9 +641,9 @@ def run_capture(
         proof["timestamp_errors"] = timestamp_errors
 
     proof_path = bundle_dir / "proof.json"
-    _write_json(proof_path, proof)
+    known_digests[proof_path.name] = _write_json(proof_path, proof)
 
-    checksum_path = _write_sha256_sums(bundle_dir)
+    checksum_path = _write_sha256_sums(bundle_dir, known_digests)
 
     _update_chain_ledger(
         output_root=output_root,
@@ -1,5 +1,6 @@
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
 import requests
@@ -12,18 +13,49 @@ from parsing import parse_price, parse_dimensions
 logger = logging.getLogger(__name__)
 
 URL = "https://gallemakelaars.nl/scheepsaanbod"
+_BASE_URL = "https://gallemakelaars.nl"
+_BG_IMAGE_RE = re.compile(r"background-image:\s*url\(['\"]?(.+?)['\"]?\)")
+
+# Detail URL variants are fetched concurrently; per-host spacing is still
+# enforced by http_utils, so this only overlaps network wait time.
+_EXECUTOR = ThreadPoolExecutor(max_workers=3, thread_name_prefix="galle-detail")
 
 
 def extract_image_url(card) -> str | None:
     """Extract background-image URL from the image div."""
-    img_div = card.select_one(".cat-product-small-image .img")
+    image_el = card.find(class_="cat-product-small-image")
+    img_div = image_el.find(class_="img") if image_el else None
     if not img_div:
         return None
-    style = img_div.get("style", "")
-    match = re.search(r"background-image:\s*url\(['\"]?(.+?)['\"]?\)", style)
+    style = img_div.get("style")
+    if not style:
+        return None
+    match = _BG_IMAGE_RE.search(style)
     return match.group(1) if match else None
 
 
+_SPEC_CELL_CLASSES = frozenset({"spec-label", "spec-value", "spec-value-1", "spec-value-2"})
+
+
+def _index_spec_row(row) -> tuple[dict, list]:
+    """Collect a spec row's cells in a single walk over its descendants.
+
+    Returns ({css_class: first element with that class}, [<label> elements]),
+    matching what per-class select_one() / find_all("label") calls would find.
+    """
+    cells = {}
+    labels = []
+    for el in row.descendants:
+        if not hasattr(el, "name") or el.name is None:
+            continue
+        if el.name == "label":
+            labels.append(el)
+        for cls in el.get("class") or ():
+            if cls in _SPEC_CELL_CLASSES and cls not in cells:
+                cells[cls] = el
+    return cells, labels
+
+
 def _parse_detail_specs(soup) -> dict:
     """Parse all specs from a detail page's .product-specs container.
 
@@ -44,7 +76,7 @@ def _parse_detail_specs(soup) -> dict:
     are prefixed to avoid collisions (e.g. "luiken > type").
     Text-only sections are stored as "section_name" key with the text value.
     """
-    containers = soup.select(".product-specs")
+    containers = soup.find_all(class_="product-specs")
     if not containers:
         return {}
 
@@ -72,31 +104,31 @@ def _parse_detail_specs(soup) -> dict:
             if not is_row:
                 continue
 
-            label_el = node.select_one(".spec-label")
-            value_el = node.select_one(".spec-value")
+            cells, labels = _index_spec_row(node)
+            label_el = cells.get("spec-label")
+            value_el = cells.get("spec-value")
 
             # Hoofdmotor rows on Galle use spec-value-1/spec-value-2
             # with an empty placeholder spec-label.
             if (not label_el or not value_el):
-                alt_label_el = node.select_one(".spec-value-1")
-                alt_value_el = node.select_one(".spec-value-2")
+                alt_label_el = cells.get("spec-value-1")
+                alt_value_el = cells.get("spec-value-2")
                 if alt_label_el and alt_value_el:
                     label_el = alt_label_el
                     value_el = alt_value_el
 
             # Fallback: some templates omit class names on label/value pairs.
             if not label_el or not value_el:
-                labels = node.find_all("label")
                 if len(labels) >= 2:
                     label_el = labels[0]
                     value_el = labels[1]
 
             # Fallback: table-style rows.
             if (not label_el or not value_el) and tag_name == "tr":
-                cells = node.find_all(["th", "td"], recursive=False)
-                if len(cells) >= 2:
-                    label_el = cells[0]
-                    value_el = cells[1]
+                table_cells = node.find_all(["th", "td"], recursive=False)
+                if len(table_cells) >= 2:
+                    label_el = table_cells[0]
+                    value_el = table_cells[1]
 
             if not label_el or not value_el:
                 continue
@@ -119,27 +151,34 @@ def _parse_detail_specs(soup) -> dict:
 
 def _parse_detail_images(soup) -> list[str]:
     """Extract all gallery image URLs from a detail page."""
-    image_urls = []
+    # dict keys keep first-seen order with O(1) duplicate checks
+    image_urls: dict[str, None] = {}
 
-    for img in soup.select("img[src]"):
-        src = img.get("src", "")
+    for img in soup.find_all("img", src=True):
+        src = img["src"]
         if "/uploads/" in src or "/scheepsaanbod/" in src:
-            if not src.startswith("http"):
-                src = f"https://gallemakelaars.nl{src}"
-            if src not in image_urls:
-                image_urls.append(src)
-
-    for div in soup.select("[style*='background-image']"):
-        style = div.get("style", "")
-        match = re.search(r"background-image:\s*url\(['\"]?(.+?)['\"]?\)", style)
+            if not src.startswith(("http://", "https://")):
+                src = _BASE_URL + src
+            image_urls.setdefault(src)
+
+    for div in soup.find_all(style=True):
+        style = div["style"]
+        if "background-image" not in style:
+            continue
+        match = _BG_IMAGE_RE.search(style)
         if match:
             src = match.group(1)
-            if not src.startswith("http"):
-                src = f"https://gallemakelaars.nl{src}"
-            if src not in image_urls:
-                image_urls.append(src)
+            if not src.startswith(("http://", "https://")):
+                src = _BASE_URL + src
+            image_urls.setdefault(src)
+
+    return list(image_urls)
+
 
-    return image_urls
+# str.translate tables: one C-level pass instead of chained str.replace calls
+_DUTCH_DECIMAL = str.maketrans({".": None, ",": "."})
+_COMMA_DECIMAL = str.maketrans({",": "."})
+_DROP_DOTS = str.maketrans({".": None})
 
 
 def _parse_dutch_number(raw: str):
@@ -151,7 +190,7 @@ def _parse_dutch_number(raw: str):
       "4,284"     → 4284.0  (comma only, non-zero fraction = thousands separator)
       "2826"      → 2826.0  (no separators)
     """
-    cleaned = raw.lower().replace("ton", "").strip()
+    cleaned = raw.lower().strip().removesuffix("ton").rstrip()
     if not cleaned:
         return None
 
@@ -160,18 +199,18 @@ def _parse_dutch_number(raw: str):
 
     if has_dot and has_comma:
         # Standard Dutch: "1.815,000" → remove dots, comma→dot
-        cleaned = cleaned.replace(".", "").replace(",", ".")
+        cleaned = cleaned.translate(_DUTCH_DECIMAL)
     elif has_comma:
-        parts = cleaned.split(",")
-        if len(parts) == 2 and len(parts[1]) == 3 and parts[1] != "000":
+        head, _, tail = cleaned.partition(",")
+        if len(tail) == 3 and tail != "000" and "," not in tail:
             # "4,284" → comma is thousands separator → 4284
-            cleaned = cleaned.replace(",", "")
+            cleaned = head + tail
         else:
             # "932,000" → comma is decimal → 932.0
-            cleaned = cleaned.replace(",", ".")
+            cleaned = cleaned.translate(_COMMA_DECIMAL)
     elif has_dot:
         # Only dot: "2.826" → thousands separator → 2826
-        cleaned = cleaned.replace(".", "")
+        cleaned = cleaned.translate(_DROP_DOTS)
 
     try:
         return float(cleaned)
@@ -191,6 +230,18 @@ def _parse_tonnage(specs: dict):
     return None
 
 
+def _fetch_detail_page(url: str) -> tuple[dict, list[str]] | None:
+    """Fetch one detail URL and return (specs, image_urls), or None on error."""
+    try:
+        resp = _fetch_with_retry(requests.get, url)
+    except requests.RequestException:
+        logger.warning("Could not fetch detail page: %s", url)
+        return None
+
+    soup = BeautifulSoup(resp.text, "html.parser")
+    return _parse_detail_specs(soup), _parse_detail_images(soup)
+
+
 def _fetch_detail(detail_url: str) -> dict:
     """Fetch a vessel detail page and extract all specs + images.
 
@@ -213,16 +264,10 @@ def _fetch_detail(detail_url: str) -> dict:
                 candidate_urls.append(alt)
 
     best_score = -1
-    for url in candidate_urls:
-        try:
-            resp = _fetch_with_retry(requests.get, url)
-        except requests.RequestException:
-            logger.warning("Could not fetch detail page: %s", url)
+    for page in _EXECUTOR.map(_fetch_detail_page, candidate_urls):
+        if page is None:
             continue
-
-        soup = BeautifulSoup(resp.text, "html.parser")
-        all_specs = _parse_detail_specs(soup)
-        image_urls = _parse_detail_images(soup)
+        all_specs, image_urls = page
 
         score = len(all_specs) + len(image_urls)
         if score <= best_score:
@@ -260,10 +305,10 @@ def parse_card(card) -> dict:
 
     link_el = card.select_one("a[href]")
     detail_url = link_el["href"] if link_el else None
-    if detail_url and not detail_url.startswith("http"):
-        detail_url = f"https://gallemakelaars.nl{detail_url}"
+    if detail_url and not detail_url.startswith(("http://", "https://")):
+        detail_url = _BASE_URL + detail_url
 
-    source_id = detail_url.rstrip("/").split("/")[-1] if detail_url else name
+    source_id = detail_url.rstrip("/").rsplit("/", 1)[-1] if detail_url else name
 
     image_url = extract_image_url(card)
 
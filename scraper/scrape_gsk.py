@@ -89,6 +89,13 @@ TYPE_MAP = {
     "NEWLY_BUILD": "Nieuwbouw",
 }
 
+# Fallbacks for range-style enums not yet in TYPE_MAP (e.g. a new TONS_ bucket)
+TYPE_PREFIX_MAP = (
+    ("TONS_", "Motorvrachtschip"),
+    ("TANKERS_", "Tankschip"),
+    ("TUG_", "Duw/Sleepboot"),
+)
+
 
 def _fetch_with_retry(url, json_body, retries=5):
     """POST a GraphQL request with exponential-backoff retries."""
@@ -99,7 +106,13 @@ def map_type(raw_type: str | None) -> str | None:
     """Map a GSK API type enum value to a Dutch vessel type name."""
     if raw_type is None:
         return None
-    return TYPE_MAP.get(raw_type)
+    mapped = TYPE_MAP.get(raw_type)
+    if mapped is not None:
+        return mapped
+    for prefix, name in TYPE_PREFIX_MAP:
+        if raw_type.startswith(prefix):
+            return name
+    return None
 
 
 def build_image_url(legacy_id: str, filename: str) -> str:
@@ -308,6 +321,16 @@ def _fetch_detail(slug: str) -> dict | None:
     return _clean_detail(resolved)
 
 
+def _to_float(value) -> float | None:
+    """Convert a numeric API value to float, or None if missing/invalid."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
 def parse_vessel(vessel: dict) -> dict | None:
     """Convert a GSK GraphQL vessel object to our vessel schema.
 
@@ -324,39 +347,16 @@ def parse_vessel(vessel: dict) -> dict | None:
         return None
 
     slug = vessel.get("slug")
+    source_id = str(slug) if slug else str(vessel.get("id"))
     legacy_id = vessel.get("legacyId")
 
-    # Price
-    price = None
-    if general.get("priceVisible") and general.get("price") is not None:
-        try:
-            price = float(general["price"])
-        except (ValueError, TypeError):
-            pass
-
-    # Dimensions
     dims = general.get("vesselDimensions") or {}
-    length_m = None
-    width_m = None
-    if dims.get("length") is not None:
-        try:
-            length_m = float(dims["length"])
-        except (ValueError, TypeError):
-            pass
-    if dims.get("width") is not None:
-        try:
-            width_m = float(dims["width"])
-        except (ValueError, TypeError):
-            pass
-
-    # Tonnage
-    tonnage = None
     tonnage_data = general.get("tonnage") or {}
-    if tonnage_data.get("maxTonnage") is not None:
-        try:
-            tonnage = float(tonnage_data["maxTonnage"])
-        except (ValueError, TypeError):
-            pass
+
+    price = _to_float(general.get("price")) if general.get("priceVisible") else None
+    length_m = _to_float(dims.get("length"))
+    width_m = _to_float(dims.get("width"))
+    tonnage = _to_float(tonnage_data.get("maxTonnage"))
 
     # Build year
     build_year = general.get("yearOfBuild")
@@ -374,12 +374,13 @@ def parse_vessel(vessel: dict) -> dict | None:
     image_url = None
     image_urls = None
     if gallery and legacy_id:
-        image_url = build_image_url(legacy_id, gallery[0]["filename"])
+        _build_url = build_image_url
         image_urls = [
-            build_image_url(legacy_id, img["filename"])
+            _build_url(legacy_id, filename)
             for img in gallery
-            if img.get("filename")
-        ]
+            if (filename := img.get("filename"))
+        ] or None
+        image_url = image_urls[0] if image_urls else None
 
     # Raw details: engine info, draft, original type enum
     raw_details = {}
@@ -402,7 +403,7 @@ def parse_vessel(vessel: dict) -> dict | None:
 
     return {
         "source": "gsk",
-        "source_id": str(slug) if slug else str(vessel.get("id")),
+        "source_id": source_id,
         "name": name,
         "type": vessel_type,
         "length_m": length_m,
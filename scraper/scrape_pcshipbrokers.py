@@ -4,7 +4,7 @@ import re
 import time
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from db import upsert_vessel
 from http_utils import fetch_with_retry as _fetch_with_retry
@@ -14,59 +14,75 @@ logger = logging.getLogger(__name__)
 
 LISTING_URL = "https://pcshipbrokers.com/scheepsaanbod"
 
+_COMPARE_JSON_PARSE_RE = re.compile(r"compareShipData:\s*JSON\.parse\('(.+?)'\)", re.DOTALL)
+_COMPARE_ASSIGN_RE = re.compile(r"compareShipData\s*=\s*(?=\{)")
+_SHIP_SLUG_RE = re.compile(r"/ships/([^/]+?)/?$")
+_NOT_A_TYPE_RE = re.compile(r"^(€|EUR|Bouwjaar|\d)")
+_GTAG_VIEW_SHIP_RE = re.compile(
+    r"gtag\s*\(\s*['\"]event['\"]\s*,\s*['\"]view_ship['\"]\s*,\s*(\{[^}]+\})"
+)
+_BG_IMAGE_RE = re.compile(r"background-image:\s*url\(['\"]?(.+?)['\"]?\)")
 
-def _parse_listing(html: str) -> list[dict]:
-    """Parse the listing page and return vessel dicts.
+# Listing cards are the only part of the page the parser needs to build
+_SHIP_LINKS = SoupStrainer("a", href=_SHIP_SLUG_RE)
+_JSON_DECODER = json.JSONDecoder()
 
-    Uses the embedded compareShipData JSON for structured data,
-    plus HTML card parsing for the vessel type (not in the JSON).
+
+def _extract_compare_data(html: str) -> dict:
+    """Pull the embedded compareShipData object straight out of the page source.
+
+    Format: compareShipData: JSON.parse('{...}') with \\u0022 escaped quotes,
+    or the older direct assignment compareShipData = {...}.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    if "compareShipData" not in html:
+        return {}
 
-    # Extract compareShipData JSON from <script> tag
-    # Format: compareShipData: JSON.parse('{...}') with \u0022 escaped quotes
     compare_data = {}
-    for script in soup.find_all("script"):
-        text = script.string or ""
-        if "compareShipData" not in text:
-            continue
-        # Match JSON.parse('...') format
-        match = re.search(r"compareShipData:\s*JSON\.parse\('(.+?)'\)", text, re.DOTALL)
+    # Match JSON.parse('...') format
+    match = _COMPARE_JSON_PARSE_RE.search(html)
+    if match:
+        try:
+            raw = match.group(1)
+            # Decode unicode escapes (\u0022 -> ")
+            decoded = raw.encode().decode("unicode_escape")
+            compare_data = json.loads(decoded)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            logger.warning("Failed to parse compareShipData JSON")
+    if not compare_data:
+        # Fallback: direct assignment format; raw_decode stops at the end of
+        # the object, so trailing script text is never scanned
+        match = _COMPARE_ASSIGN_RE.search(html)
         if match:
             try:
-                raw = match.group(1)
-                # Decode unicode escapes (\u0022 -> ")
-                decoded = raw.encode().decode("unicode_escape")
-                compare_data = json.loads(decoded)
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                logger.warning("Failed to parse compareShipData JSON")
-        if not compare_data:
-            # Fallback: try direct assignment format
-            match = re.search(r"compareShipData\s*=\s*(\{.+\})", text, re.DOTALL)
-            if match:
-                try:
-                    compare_data = json.loads(match.group(1))
-                except json.JSONDecodeError:
-                    pass
-        break
+                compare_data, _ = _JSON_DECODER.raw_decode(html, match.end())
+            except json.JSONDecodeError:
+                pass
+    return compare_data if isinstance(compare_data, dict) else {}
+
+
+def _parse_listing(html: str) -> list[dict]:
+    """Parse the listing page and return vessel dicts.
 
+    Uses the embedded compareShipData JSON for structured data,
+    plus HTML card parsing for the vessel type (not in the JSON).
+    """
+    compare_data = _extract_compare_data(html)
     if not compare_data:
-        logger.warning("compareShipData not found, falling back to HTML-only parsing")
+        logger.error("compareShipData not found, no listings parsed")
+        return []
+
+    soup = BeautifulSoup(html, "html.parser", parse_only=_SHIP_LINKS)
 
     # Parse HTML cards to extract type per vessel slug
     type_by_slug = {}
-    for link in soup.select('a[href*="/ships/"]'):
-        href = link.get("href", "")
-        slug_match = re.search(r"/ships/([^/]+?)/?$", href)
-        if not slug_match:
-            continue
-        slug = slug_match.group(1)
+    for link in soup.find_all("a", href=_SHIP_SLUG_RE):
+        slug = _SHIP_SLUG_RE.search(link["href"]).group(1)
         # Text parts: [name, type, "Bouwjaar YYYY", "100,00 m x 11,40 m", "3.152 ton", "€ 1.795.000,-"]
         texts = [t.strip() for t in link.stripped_strings if t.strip()]
         if len(texts) >= 2:
             candidate = texts[1]
             # Skip if it looks like a year, price, dimension, or tonnage
-            if not re.match(r"^(€|EUR|Bouwjaar|\d)", candidate) and " x " not in candidate:
+            if not _NOT_A_TYPE_RE.match(candidate) and " x " not in candidate:
                 type_by_slug[slug] = candidate
 
     vessels = []
@@ -133,10 +149,7 @@ def _fetch_detail(detail_url: str) -> dict:
     for script in soup.find_all("script"):
         text = script.string or ""
         if "view_ship" in text:
-            match = re.search(
-                r"gtag\s*\(\s*['\"]event['\"]\s*,\s*['\"]view_ship['\"]\s*,\s*(\{[^}]+\})",
-                text,
-            )
+            match = _GTAG_VIEW_SHIP_RE.search(text)
             if match:
                 try:
                     all_specs["_gtag"] = json.loads(match.group(1))
@@ -155,7 +168,7 @@ def _fetch_detail(detail_url: str) -> dict:
 
     for el in soup.select("[style*='background-image']"):
         style = el.get("style", "")
-        match = re.search(r"background-image:\s*url\(['\"]?(.+?)['\"]?\)", style)
+        match = _BG_IMAGE_RE.search(style)
         if match:
             src = match.group(1).split("?")[0]
             if "cdn.pcshipbrokers.com" in src and src not in image_urls:
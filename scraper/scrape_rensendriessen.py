@@ -11,6 +11,16 @@ logger = logging.getLogger(__name__)
 API_URL = "https://api.rensendriessen.com/api/public/ships/brokers/list/filter/"
 MAX_PAGES = 50
 
+# Keys kept out of raw_details: images are stored separately
+_RAW_DETAILS_EXCLUDE = frozenset({"images"})
+
+# Depth-specific tonnage fields, used when content_ship_space_capacity is missing
+_TONNAGE_FIELDS = (
+    "tonnage_1_50", "tonnage_2_00", "tonnage_2_50",
+    "tonnage_2_60", "tonnage_2_80", "tonnage_3_00m", "tonnage_3_50m",
+    "tonnage_max",
+)
+
 
 def parse_bool(value) -> bool:
     """Backwards-compatible wrapper for shared parsing utility."""
@@ -53,7 +63,7 @@ def parse_vessel(ship: dict) -> dict:
     # and bin_* fields (all empty/unused)
     raw_details = {
         k: v for k, v in ship.items()
-        if k != "images" and not k.startswith("bin_")
+        if k not in _RAW_DETAILS_EXCLUDE and not k.startswith("bin_")
     }
 
     # Primary: use content_ship_space_capacity (matches website "Max. Tonnage")
@@ -61,12 +71,7 @@ def parse_vessel(ship: dict) -> dict:
 
     # Fallback: max of depth-specific fields
     if not tonnage:
-        tonnage_fields = [
-            "tonnage_1_50", "tonnage_2_00", "tonnage_2_50",
-            "tonnage_2_60", "tonnage_2_80", "tonnage_3_00m", "tonnage_3_50m",
-            "tonnage_max",
-        ]
-        tonnage_values = [ship.get(f) for f in tonnage_fields if ship.get(f)]
+        tonnage_values = [value for f in _TONNAGE_FIELDS if (value := ship.get(f))]
         tonnage = max(tonnage_values) if tonnage_values else None
 
     return {
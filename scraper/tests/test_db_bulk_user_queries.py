@@ -0,0 +1,122 @@
+"""Tests for the chunked multi-user watchlist and saved-search queries."""
+
+from unittest.mock import patch
+
+import db
+
+
+class _FakeQuery:
+    """Minimal PostgREST query builder recording the user ids and row range of each request."""
+
+    def __init__(self, rows, requested_chunks, requested_ranges):
+        self._rows = rows
+        self._requested_chunks = requested_chunks
+        self._requested_ranges = requested_ranges
+        self._user_ids = None
+        self._range = None
+
+    def select(self, *_args):
+        return self
+
+    def eq(self, column, value):
+        self._rows = [row for row in self._rows if row.get(column) == value]
+        return self
+
+    def in_(self, column, values):
+        assert column == "user_id"
+        self._requested_chunks.append(list(values))
+        self._user_ids = set(values)
+        return self
+
+    def order(self, column):
+        self._rows = sorted(self._rows, key=lambda row: row[column])
+        return self
+
+    def range(self, start, end):
+        self._requested_ranges.append((start, end))
+        self._range = (start, end)
+        return self
+
+    def execute(self):
+        rows = [r for r in self._rows if r["user_id"] in self._user_ids]
+        start, end = self._range
+        return type("_Res", (), {"data": rows[start:end + 1]})()
+
+
+class _FakeSupabase:
+    def __init__(self, rows):
+        self.rows = rows
+        self.requested_chunks: list[list[str]] = []
+        self.requested_ranges: list[tuple[int, int]] = []
+
+    def table(self, _name):
+        return _FakeQuery(self.rows, self.requested_chunks, self.requested_ranges)
+
+
+_USER_IDS = [f"u{i}" for i in range(5)]
+
+
+class TestGetWatchlistsForUsers:
+    def test_splits_user_ids_into_chunks_and_merges(self):
+        fake = _FakeSupabase([
+            {"id": "w1", "user_id": "u0", "vessel_id": "v1", "notify_price_change": False, "notify_status_change": True},
+            {"id": "w2", "user_id": "u4", "vessel_id": "v2", "notify_price_change": True, "notify_status_change": True},
+        ])
+        with patch.object(db, "supabase", fake), patch.object(db, "USER_ID_CHUNK_SIZE", 2):
+            result = db.get_watchlists_for_users(_USER_IDS)
+
+        assert fake.requested_chunks == [["u0", "u1"], ["u2", "u3"], ["u4"]]
+        assert result == {
+            "u0": {"v1": {"notify_price_change": False, "notify_status_change": True}},
+            "u1": {},
+            "u2": {},
+            "u3": {},
+            "u4": {"v2": {"notify_price_change": True, "notify_status_change": True}},
+        }
+
+    def test_pages_past_a_full_response(self):
+        fake = _FakeSupabase([
+            {"id": f"w{i}", "user_id": "u0", "vessel_id": f"v{i}"} for i in range(3)
+        ])
+        with patch.object(db, "supabase", fake), patch.object(db, "ROW_PAGE_SIZE", 2):
+            result = db.get_watchlists_for_users(["u0"])
+
+        assert fake.requested_ranges == [(0, 1), (2, 3)]
+        assert sorted(result["u0"]) == ["v0", "v1", "v2"]
+
+    def test_no_users_issues_no_query(self):
+        fake = _FakeSupabase([])
+        with patch.object(db, "supabase", fake):
+            assert db.get_watchlists_for_users([]) == {}
+        assert fake.requested_chunks == []
+
+
+class TestGetSavedSearchesForUsers:
+    def test_splits_user_ids_into_chunks_and_merges(self):
+        fake = _FakeSupabase([
+            {"id": "s1", "user_id": "u1", "active": True, "frequency": "daily"},
+            {"id": "s2", "user_id": "u3", "active": True, "frequency": "daily"},
+            {"id": "s3", "user_id": "u3", "active": True, "frequency": "weekly"},
+            {"id": "s4", "user_id": "u4", "active": False, "frequency": "daily"},
+        ])
+        with patch.object(db, "supabase", fake), patch.object(db, "USER_ID_CHUNK_SIZE", 2):
+            result = db.get_saved_searches_for_users(_USER_IDS, frequency="daily")
+
+        assert fake.requested_chunks == [["u0", "u1"], ["u2", "u3"], ["u4"]]
+        assert {user_id: [s["id"] for s in rows] for user_id, rows in result.items()} == {
+            "u0": [],
+            "u1": ["s1"],
+            "u2": [],
+            "u3": ["s2"],
+            "u4": [],
+        }
+
+    def test_pages_past_a_full_response(self):
+        fake = _FakeSupabase([
+            {"id": f"s{i}", "user_id": "u0", "active": True, "frequency": "daily"} for i in range(4)
+        ])
+        with patch.object(db, "supabase", fake), patch.object(db, "ROW_PAGE_SIZE", 2):
+            result = db.get_saved_searches_for_users(["u0"], frequency="daily")
+
+        assert fake.requested_ranges == [(0, 1), (2, 3), (4, 5)]
+        assert [s["id"] for s in result["u0"]] == ["s0", "s1", "s2", "s3"]
@@ -1,3 +1,6 @@
+import threading
+
+import pytest
 from bs4 import BeautifulSoup
 
 from scrape_galle import (
@@ -205,46 +208,49 @@ DETAIL_HTML = '''
 '''
 
 
-class TestParseDetailSpecs:
-    def _soup(self, html=DETAIL_HTML):
-        return BeautifulSoup(html, "html.parser")
+@pytest.fixture(scope="module")
+def detail_soup():
+    """DETAIL_HTML parsed once per module; the parsers under test only read it."""
+    return BeautifulSoup(DETAIL_HTML, "html.parser")
+
 
-    def test_algemeen_fields(self):
-        specs = _parse_detail_specs(self._soup())
+class TestParseDetailSpecs:
+    def test_algemeen_fields(self, detail_soup):
+        specs = _parse_detail_specs(detail_soup)
         assert specs["naam"] == "Isella"
         assert specs["type schip"] == "Motorvrachtschip"
         assert specs["bouwjaar"] == "1970"
         assert specs["scheepswerf"] == "De Schroef te Sluiskil"
 
-    def test_tonnenmaat_prefixed(self):
-        specs = _parse_detail_specs(self._soup())
+    def test_tonnenmaat_prefixed(self, detail_soup):
+        specs = _parse_detail_specs(detail_soup)
         assert specs["tonnenmaat > maximum diepgang (t)"] == "1.815,000"
         assert specs["tonnenmaat > op 2m00 (t)"] == "932,000"
 
-    def test_afmetingen_prefixed(self):
-        specs = _parse_detail_specs(self._soup())
+    def test_afmetingen_prefixed(self, detail_soup):
+        specs = _parse_detail_specs(detail_soup)
         assert specs["afmetingen > lengte (m)"] == "85,00"
         assert specs["afmetingen > breedte (m)"] == "9,50"
 
-    def test_text_only_sections(self):
-        specs = _parse_detail_specs(self._soup())
+    def test_text_only_sections(self, detail_soup):
+        specs = _parse_detail_specs(detail_soup)
         assert specs["buikdenning"] == "Staal 12mm"
         assert "De Groot/Van Ballegooy" in specs["kopschroef"]
 
-    def test_luiken_prefixed(self):
-        specs = _parse_detail_specs(self._soup())
+    def test_luiken_prefixed(self, detail_soup):
+        specs = _parse_detail_specs(detail_soup)
         assert specs["luiken > type"] == "friese kap aluminium luiken"
         assert specs["luiken > bouwjaar"] == "2006"
 
-    def test_motor_prefixed(self):
-        specs = _parse_detail_specs(self._soup())
+    def test_motor_prefixed(self, detail_soup):
+        specs = _parse_detail_specs(detail_soup)
         assert specs["hoofdmotor(en) > fabr. merk"] == "Scania"
         assert specs["hoofdmotor(en) > pk"] == "550"
         assert specs["hoofdmotor(en) > kw"] == "404"
 
-    def test_no_collision_bouwjaar(self):
+    def test_no_collision_bouwjaar(self, detail_soup):
         """bouwjaar appears in Algemeen and Luiken — they should not collide."""
-        specs = _parse_detail_specs(self._soup())
+        specs = _parse_detail_specs(detail_soup)
         assert specs["bouwjaar"] == "1970"
         assert specs["luiken > bouwjaar"] == "2006"
 
@@ -343,24 +349,21 @@ class TestParseDetailSpecs:
 
 
 class TestParseDetailImages:
-    def _soup(self, html=DETAIL_HTML):
-        return BeautifulSoup(html, "html.parser")
-
-    def test_extracts_upload_images(self):
-        images = _parse_detail_images(self._soup())
+    def test_extracts_upload_images(self, detail_soup):
+        images = _parse_detail_images(detail_soup)
         assert "https://gallemakelaars.nl/uploads/ships/photo1.jpg" in images
         assert "https://gallemakelaars.nl/uploads/ships/photo2.jpg" in images
 
-    def test_extracts_background_images(self):
-        images = _parse_detail_images(self._soup())
+    def test_extracts_background_images(self, detail_soup):
+        images = _parse_detail_images(detail_soup)
         assert "https://gallemakelaars.nl/uploads/ships/photo3.jpg" in images
 
-    def test_skips_non_upload_images(self):
-        images = _parse_detail_images(self._soup())
+    def test_skips_non_upload_images(self, detail_soup):
+        images = _parse_detail_images(detail_soup)
         assert not any("logo.png" in url for url in images)
 
-    def test_no_duplicates(self):
-        images = _parse_detail_images(self._soup())
+    def test_no_duplicates(self, detail_soup):
+        images = _parse_detail_images(detail_soup)
         assert len(images) == len(set(images))
 
     def test_empty_page(self):
@@ -460,13 +463,15 @@ def test_fetch_detail_prefers_richer_url_variant(monkeypatch):
     """
 
     calls = []
+    calls_lock = threading.Lock()
 
     class _Resp:
         def __init__(self, text: str):
             self.text = text
 
     def _fake_fetch(_method, url, **_kwargs):
-        calls.append(url)
+        with calls_lock:
+            calls.append(url)
         if "/scheepsaanbod/" in url:
             return _Resp(rich_html)
         return _Resp(sparse_html)
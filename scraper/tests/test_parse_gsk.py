@@ -1,73 +1,96 @@
-from scrape_gsk import map_type, build_image_url, parse_vessel, _resolve_title, _clean_detail, _resolve_titles_recursive, _unwrap_type
+import copy
+
+import pytest
+
+from scrape_gsk import TYPE_MAP, TYPE_PREFIX_MAP, map_type, build_image_url, parse_vessel, _resolve_title, _clean_detail, _resolve_titles_recursive, _unwrap_type
+
+
+_VESSEL_TEMPLATE = {
+    "id": "69844e25a49893e3ddaf2ae0",
+    "legacyId": "6279264777273344",
+    "vesselName": "Montana II",
+    "slug": "montana-ii",
+    "general": {
+        "type": "PUSH_BARGE",
+        "yearOfBuild": 1992,
+        "price": 895000,
+        "priceVisible": True,
+        "priceDropped": None,
+        "status": "FOR_SALE",
+        "vesselDimensions": {"length": 92.12, "width": 11.49, "draft": 3.71},
+        "tonnage": {"maxTonnage": 2480.23},
+    },
+    "gallery": [
+        {"filename": "Montana 1.jpg"},
+        {"filename": "MK 13.jpeg"},
+    ],
+    "technics": {
+        "engines": [
+            {"make": "Cummins", "power": 775, "powerType": "HP", "yearOfBuild": 2006}
+        ]
+    },
+}
+
+
+# Template sections that overrides merge into instead of replacing
+_MERGEABLE = frozenset({"general", "technics"})
 
 
 def _make_vessel(overrides=None):
-    """Build a sample GSK GraphQL vessel dict for testing."""
-    base = {
-        "id": "69844e25a49893e3ddaf2ae0",
-        "legacyId": "6279264777273344",
-        "vesselName": "Montana II",
-        "slug": "montana-ii",
-        "general": {
-            "type": "PUSH_BARGE",
-            "yearOfBuild": 1992,
-            "price": 895000,
-            "priceVisible": True,
-            "priceDropped": None,
-            "status": "FOR_SALE",
-            "vesselDimensions": {"length": 92.12, "width": 11.49, "draft": 3.71},
-            "tonnage": {"maxTonnage": 2480.23},
-        },
-        "gallery": [
-            {"filename": "Montana 1.jpg"},
-            {"filename": "MK 13.jpeg"},
-        ],
-        "technics": {
-            "engines": [
-                {"make": "Cummins", "power": 775, "powerType": "HP", "yearOfBuild": 2006}
-            ]
-        },
-    }
-    if overrides:
-        for key, value in overrides.items():
-            if isinstance(value, dict) and isinstance(base.get(key), dict):
-                base[key].update(value)
-            else:
-                base[key] = value
-    return base
+    """Build a sample GSK GraphQL vessel dict for testing.
+
+    Overrides are applied with dict unpacking; mergeable sections named in
+    ``overrides`` are merged into the template's section instead of
+    replacing it.  The result is always a deep copy, so tests can never
+    leak changes into each other.
+    """
+    if not overrides:
+        return copy.deepcopy(_VESSEL_TEMPLATE)
+    vessel = {**_VESSEL_TEMPLATE, **overrides}
+    for key in _MERGEABLE.intersection(overrides):
+        vessel[key] = {**_VESSEL_TEMPLATE[key], **overrides[key]}
+    return copy.deepcopy(vessel)
+
+
+_MAP_TYPE_CASES = [
+    ("PUSH_BARGE", "Duwbak"),
+    ("PUSH_BOAT", "Duw/Sleepboot"),
+    ("TONS_250_399", "Motorvrachtschip"),
+    ("TONS_400_499", "Motorvrachtschip"),
+    ("TONS_500_749", "Motorvrachtschip"),
+    ("TONS_750_999", "Motorvrachtschip"),
+    ("TONS_1000_1499", "Motorvrachtschip"),
+    ("TONS_1500", "Motorvrachtschip"),
+    ("TANKERS_9005_9995", "Tankschip"),
+    ("CEMENT_TANKER", "Tankschip"),
+    ("POWDER_TANKER", "Tankschip"),
+    ("YAUGHT", "Jacht"),
+    ("HOUSEBOAT", "Woonschip"),
+    ("DUMP_BARGE", "Beunschip"),
+    ("BARGE", "Koppelverband"),
+    ("TUG_105_195", "Duw/Sleepboot"),
+    ("PASSENGER_SHIP", "Passagiersschip"),
+    ("NEWLY_BUILD", "Nieuwbouw"),
+    # Range enums not (yet) in TYPE_MAP fall back to their prefix
+    ("TONS_2000_2999", "Motorvrachtschip"),
+    ("TANKERS_10000", "Tankschip"),
+    ("TUG_200_299", "Duw/Sleepboot"),
+    (None, None),
+    ("UNKNOWN_FUTURE_TYPE", None),
+]
 
 
 class TestMapType:
-    def test_push_barge(self):
-        assert map_type("PUSH_BARGE") == "Duwbak"
-
-    def test_push_boat(self):
-        assert map_type("PUSH_BOAT") == "Duw/Sleepboot"
-
-    def test_tonnage_variants_all_motorvrachtschip(self):
-        for t in ("TONS_250_399", "TONS_400_499", "TONS_500_749",
-                   "TONS_750_999", "TONS_1000_1499", "TONS_1500"):
-            assert map_type(t) == "Motorvrachtschip", f"Failed for {t}"
-
-    def test_tanker_types(self):
-        assert map_type("TANKERS_9005_9995") == "Tankschip"
-        assert map_type("CEMENT_TANKER") == "Tankschip"
-        assert map_type("POWDER_TANKER") == "Tankschip"
-
-    def test_other_types(self):
-        assert map_type("YAUGHT") == "Jacht"
-        assert map_type("HOUSEBOAT") == "Woonschip"
-        assert map_type("DUMP_BARGE") == "Beunschip"
-        assert map_type("BARGE") == "Koppelverband"
-        assert map_type("TUG_105_195") == "Duw/Sleepboot"
-        assert map_type("PASSENGER_SHIP") == "Passagiersschip"
-        assert map_type("NEWLY_BUILD") == "Nieuwbouw"
-
-    def test_none(self):
-        assert map_type(None) is None
-
-    def test_unknown_type(self):
-        assert map_type("UNKNOWN_FUTURE_TYPE") is None
+    @pytest.mark.parametrize("raw_type, expected", _MAP_TYPE_CASES)
+    def test_map_type(self, raw_type, expected):
+        assert map_type(raw_type) == expected
+
+    @pytest.mark.parametrize("prefix, name", TYPE_PREFIX_MAP)
+    def test_every_prefix_fallback_has_a_case(self, prefix, name):
+        assert any(
+            raw is not None and raw.startswith(prefix) and raw not in TYPE_MAP and expected == name
+            for raw, expected in _MAP_TYPE_CASES
+        )
 
 
 class TestBuildImageUrl:
@@ -84,103 +107,90 @@ class TestBuildImageUrl:
         assert url.startswith("https://gskbrokers.imgix.net/vessels/123/images/")
 
 
+@pytest.fixture(scope="module")
+def default_parsed():
+    """parse_vessel() of the unmodified template, shared by read-only tests."""
+    return parse_vessel(_make_vessel())
+
+
 class TestParseVessel:
-    def test_basic_vessel(self):
-        v = parse_vessel(_make_vessel())
-        assert v["source"] == "gsk"
-        assert v["source_id"] == "montana-ii"
-        assert v["name"] == "Montana II"
-        assert v["type"] == "Duwbak"
-        assert v["length_m"] == 92.12
-        assert v["width_m"] == 11.49
-        assert v["build_year"] == 1992
-        assert v["tonnage"] == 2480.23
-        assert v["price"] == 895000.0
-        assert v["url"] == "https://www.gskbrokers.eu/nl/schip/montana-ii"
-
-    def test_image_url(self):
-        v = parse_vessel(_make_vessel())
+    def test_basic_vessel(self, default_parsed):
+        expected = {
+            "source": "gsk",
+            "source_id": "montana-ii",
+            "name": "Montana II",
+            "type": "Duwbak",
+            "length_m": 92.12,
+            "width_m": 11.49,
+            "build_year": 1992,
+            "tonnage": 2480.23,
+            "price": 895000.0,
+            "url": "https://www.gskbrokers.eu/nl/schip/montana-ii",
+        }
+        assert {k: default_parsed[k] for k in expected} == expected
+
+    def test_image_url(self, default_parsed):
+        v = default_parsed
         assert v["image_url"] == (
             "https://gskbrokers.imgix.net/vessels/6279264777273344"
             "/images/Montana 1.jpg?fit=crop&w=600&h=400"
         )
 
-    def test_image_urls_list(self):
-        v = parse_vessel(_make_vessel())
+    def test_image_urls_list(self, default_parsed):
+        v = default_parsed
         assert len(v["image_urls"]) == 2
         assert "Montana 1.jpg" in v["image_urls"][0]
         assert "MK 13.jpeg" in v["image_urls"][1]
 
-    def test_not_for_sale_skipped(self):
-        v = parse_vessel(_make_vessel({"general": {"status": "SOLD"}}))
-        assert v is None
-
-    def test_price_not_visible(self):
-        v = parse_vessel(_make_vessel({"general": {"priceVisible": False}}))
-        assert v["price"] is None
-
-    def test_price_none(self):
-        v = parse_vessel(_make_vessel({"general": {"price": None}}))
-        assert v["price"] is None
-
-    def test_no_gallery(self):
-        v = parse_vessel(_make_vessel({"gallery": []}))
-        assert v["image_url"] is None
-        assert v["image_urls"] is None
-
-    def test_no_tonnage(self):
-        v = parse_vessel(_make_vessel({"general": {"tonnage": {"maxTonnage": None}}}))
-        assert v["tonnage"] is None
-
-    def test_no_dimensions(self):
-        v = parse_vessel(_make_vessel({"general": {"vesselDimensions": {}}}))
-        assert v["length_m"] is None
-        assert v["width_m"] is None
-
-    def test_raw_details_contains_engine(self):
-        v = parse_vessel(_make_vessel())
+    @pytest.mark.parametrize("overrides, checks", [
+        pytest.param({"general": {"priceVisible": False}}, {"price": None}, id="price_not_visible"),
+        pytest.param({"general": {"price": None}}, {"price": None}, id="price_none"),
+        pytest.param({"gallery": []}, {"image_url": None, "image_urls": None}, id="no_gallery"),
+        pytest.param({"general": {"tonnage": {"maxTonnage": None}}}, {"tonnage": None}, id="no_tonnage"),
+        pytest.param({"general": {"vesselDimensions": {}}}, {"length_m": None, "width_m": None}, id="no_dimensions"),
+        pytest.param({"general": {"yearOfBuild": None}}, {"build_year": None}, id="build_year_none"),
+        pytest.param({"slug": None}, {"source_id": "69844e25a49893e3ddaf2ae0", "url": None}, id="no_slug_uses_id"),
+    ])
+    def test_override_effects(self, overrides, checks):
+        v = parse_vessel(_make_vessel(overrides))
+        assert {k: v[k] for k in checks} == checks
+
+    @pytest.mark.parametrize("overrides", [
+        pytest.param({"general": {"status": "SOLD"}}, id="not_for_sale"),
+        pytest.param({"vesselName": ""}, id="empty_name"),
+        pytest.param({"vesselName": None}, id="none_name"),
+        pytest.param({"vesselName": "   "}, id="whitespace_name"),
+    ])
+    def test_skipped(self, overrides):
+        assert parse_vessel(_make_vessel(overrides)) is None
+
+    def test_gallery_entries_without_filename_skipped(self):
+        v = parse_vessel(_make_vessel({"gallery": [{"filename": None}, {"filename": "MK 13.jpeg"}]}))
+        assert "MK 13.jpeg" in v["image_url"]
+        assert v["image_urls"] == [v["image_url"]]
+
+    def test_raw_details_contains_engine(self, default_parsed):
+        v = default_parsed
         assert v["raw_details"] is not None
         assert "engines" in v["raw_details"]
         assert v["raw_details"]["engines"][0]["make"] == "Cummins"
 
-    def test_raw_details_contains_draft(self):
-        v = parse_vessel(_make_vessel())
+    def test_raw_details_contains_draft(self, default_parsed):
+        v = default_parsed
         assert v["raw_details"]["draft"] == 3.71
 
-    def test_raw_details_contains_gsk_type(self):
-        v = parse_vessel(_make_vessel())
+    def test_raw_details_contains_gsk_type(self, default_parsed):
+        v = default_parsed
         assert v["raw_details"]["gsk_type"] == "PUSH_BARGE"
 
     def test_no_engines(self):
         v = parse_vessel(_make_vessel({"technics": {"engines": []}}))
         assert "engines" not in (v["raw_details"] or {})
 
-    def test_no_slug_uses_id(self):
-        vessel = _make_vessel({"slug": None})
-        v = parse_vessel(vessel)
-        assert v["source_id"] == "69844e25a49893e3ddaf2ae0"
-        assert v["url"] is None
-
-    def test_build_year_none(self):
-        v = parse_vessel(_make_vessel({"general": {"yearOfBuild": None}}))
-        assert v["build_year"] is None
-
     def test_price_dropped_in_raw_details(self):
         v = parse_vessel(_make_vessel({"general": {"priceDropped": True}}))
         assert v["raw_details"]["price_dropped"] is True
 
-    def test_empty_name_skipped(self):
-        v = parse_vessel(_make_vessel({"vesselName": ""}))
-        assert v is None
-
-    def test_none_name_skipped(self):
-        v = parse_vessel(_make_vessel({"vesselName": None}))
-        assert v is None
-
-    def test_whitespace_name_skipped(self):
-        v = parse_vessel(_make_vessel({"vesselName": "   "}))
-        assert v is None
-
 
 class TestResolveTitle:
     def test_nl_preferred(self):
@@ -206,21 +216,15 @@ class TestResolveTitle:
 
 
 class TestCleanDetail:
-    def test_removes_none_values(self):
-        assert _clean_detail({"a": 1, "b": None}) == {"a": 1}
-
-    def test_removes_empty_dicts(self):
-        assert _clean_detail({"a": 1, "b": {}}) == {"a": 1}
-
-    def test_removes_empty_lists(self):
-        assert _clean_detail({"a": 1, "b": []}) == {"a": 1}
-
-    def test_nested_cleanup(self):
-        result = _clean_detail({"a": {"b": None, "c": 1}})
-        assert result == {"a": {"c": 1}}
-
-    def test_fully_empty_returns_none(self):
-        assert _clean_detail({"a": None, "b": {}}) is None
+    @pytest.mark.parametrize("payload,expected", [
+        pytest.param({"a": 1, "b": None}, {"a": 1}, id="removes-none"),
+        pytest.param({"a": 1, "b": {}}, {"a": 1}, id="removes-empty-dict"),
+        pytest.param({"a": 1, "b": []}, {"a": 1}, id="removes-empty-list"),
+        pytest.param({"a": {"b": None, "c": 1}}, {"a": {"c": 1}}, id="nested"),
+        pytest.param({"a": None, "b": {}}, None, id="fully-empty"),
+    ])
+    def test_clean_detail(self, payload, expected):
+        assert _clean_detail(payload) == expected
 
 
 class TestResolveTitlesRecursive:
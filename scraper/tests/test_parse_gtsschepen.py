@@ -1,4 +1,6 @@
-from bs4 import BeautifulSoup
+import functools
+
+from bs4 import BeautifulSoup, SoupStrainer
 
 from scrape_gtsschepen import (
     parse_price,
@@ -63,36 +65,46 @@ class TestParseBuildYear:
         assert parse_build_year(None) is None
 
 
-class TestParseCard:
-    def _make_card_html(
-        self,
-        name="Test Ship",
-        price="€ 395.000,-",
-        specs_lines=None,
-        href="/schepen/test-ship/",
-        label=None,
-        image_url="https://www.gtsschepen.nl/wp-content/uploads/2026/01/ship.jpg",
-    ):
-        if specs_lines is None:
-            specs_lines = ["Motorvrachtschip", "1128 ton", "80.14m x 8.21m"]
-        specs_html = "<br>".join(specs_lines)
-        label_html = f'<div class="item-label">{label}</div>' if label else ""
-        return f"""
-        <div class="grid-item">
-            <div class="item-image" style="background-image: url('{image_url}')">
-                {label_html}
-            </div>
-            <div class="item-content text-center">
-                <h3><a href="{href}">{name}</a></h3>
-                <p><strong>{price}</strong></p>
-                <p>{specs_html}</p>
-            </div>
+# Same tree builder as scrape_gtsschepen, so cards parse exactly as in production
+_PARSER = "html.parser"
+# Only build the card subtree; the surrounding whitespace is never read
+_CARD_ONLY = SoupStrainer("div", class_="grid-item")
+
+
+@functools.lru_cache(maxsize=None)
+def _make_card_html(
+    name="Test Ship",
+    price="€ 395.000,-",
+    specs_lines=("Motorvrachtschip", "1128 ton", "80.14m x 8.21m"),
+    href="/schepen/test-ship/",
+    label=None,
+    image_url="https://www.gtsschepen.nl/wp-content/uploads/2026/01/ship.jpg",
+):
+    specs_html = "<br>".join(specs_lines)
+    label_html = f'<div class="item-label">{label}</div>' if label else ""
+    return f"""
+    <div class="grid-item">
+        <div class="item-image" style="background-image: url('{image_url}')">
+            {label_html}
         </div>
-        """
+        <div class="item-content text-center">
+            <h3><a href="{href}">{name}</a></h3>
+            <p><strong>{price}</strong></p>
+            <p>{specs_html}</p>
+        </div>
+    </div>
+    """
+
 
+def _make_card_soup(**kwargs):
+    """Parse a fresh card tag from the (cached) HTML for each test."""
+    html = _make_card_html(**kwargs)
+    return BeautifulSoup(html, _PARSER, parse_only=_CARD_ONLY).find(class_="grid-item")
+
+
+class TestParseCard:
     def test_basic_card(self):
-        html = self._make_card_html()
-        card = BeautifulSoup(html, "html.parser").select_one(".grid-item")
+        card = _make_card_soup()
         result = parse_card(card)
         assert result["source"] == "gtsschepen"
         assert result["source_id"] == "test-ship"
@@ -104,46 +116,39 @@ class TestParseCard:
         assert result["price"] == 395000.0
 
     def test_sold_vessel_has_is_sold_true(self):
-        html = self._make_card_html(label="Verkocht")
-        card = BeautifulSoup(html, "html.parser").select_one(".grid-item")
+        card = _make_card_soup(label="Verkocht")
         result = parse_card(card)
         assert result is not None
         assert result["is_sold"] is True
         assert result["name"] == "Test Ship"
 
     def test_active_vessel_has_is_sold_false(self):
-        html = self._make_card_html()
-        card = BeautifulSoup(html, "html.parser").select_one(".grid-item")
+        card = _make_card_soup()
         result = parse_card(card)
         assert result["is_sold"] is False
 
     def test_nieuw_label_still_parsed(self):
-        html = self._make_card_html(label="Nieuw")
-        card = BeautifulSoup(html, "html.parser").select_one(".grid-item")
+        card = _make_card_soup(label="Nieuw")
         result = parse_card(card)
         assert result is not None
         assert result["name"] == "Test Ship"
 
     def test_with_build_year(self):
-        html = self._make_card_html(specs_lines=["Motorvrachtschip", "1128 ton", "80.14m x 8.21m", "| Bouwjr 1960"])
-        card = BeautifulSoup(html, "html.parser").select_one(".grid-item")
+        card = _make_card_soup(specs_lines=("Motorvrachtschip", "1128 ton", "80.14m x 8.21m", "| Bouwjr 1960"))
         result = parse_card(card)
         assert result["build_year"] == 1960
 
     def test_no_price(self):
-        html = self._make_card_html(price="")
-        card = BeautifulSoup(html, "html.parser").select_one(".grid-item")
+        card = _make_card_soup(price="")
         result = parse_card(card)
         assert result["price"] is None
 
     def test_image_url(self):
-        html = self._make_card_html()
-        card = BeautifulSoup(html, "html.parser").select_one(".grid-item")
+        card = _make_card_soup()
         result = parse_card(card)
         assert result["image_url"] == "https://www.gtsschepen.nl/wp-content/uploads/2026/01/ship.jpg"
 
     def test_image_url_strips_whitespace(self):
-        html = self._make_card_html(image_url="https://www.gtsschepen.nl/wp-content/uploads/2026/01/ship.jpg   ")
-        card = BeautifulSoup(html, "html.parser").select_one(".grid-item")
+        card = _make_card_soup(image_url="https://www.gtsschepen.nl/wp-content/uploads/2026/01/ship.jpg   ")
         result = parse_card(card)
         assert result["image_url"] == "https://www.gtsschepen.nl/wp-content/uploads/2026/01/ship.jpg"
@@ -102,6 +102,32 @@ class TestParseListing:
         assert v["tonnage"] == 3000.0
         assert v["price"] == 1500000.0
 
+    def test_json_parse_format(self):
+        html = r"""
+        <html><body>
+        <script>
+        window.app = {compareShipData: JSON.parse('{\u0022parse-ship\u0022: {\u0022name\u0022: \u0022Parse Ship\u0022, \u0022price\u0022: \u0022\u20ac 100.000,-\u0022}}')};
+        </script>
+        </body></html>
+        """
+        vessels = _parse_listing(html)
+        assert len(vessels) == 1
+        assert vessels[0]["source_id"] == "parse-ship"
+        assert vessels[0]["name"] == "Parse Ship"
+        assert vessels[0]["price"] == 100000.0
+
+    def test_assignment_followed_by_more_script(self):
+        html = """
+        <html><body>
+        <script>
+        compareShipData = {"next-ship": {"name": "Next Ship", "price": "€ 100.000,-"}};
+        var filters = {"type": "all"};
+        </script>
+        </body></html>
+        """
+        vessels = _parse_listing(html)
+        assert [v["source_id"] for v in vessels] == ["next-ship"]
+
     def test_skips_sold_vessels(self):
         html = """
         <html><body>
@@ -46,6 +46,10 @@ class TestGetFeatures:
         assert f["tonnage"] == 1200
         assert f["age"] == datetime.now(timezone.utc).year - 1990
 
+    def test_explicit_current_year(self):
+        f = price_model._get_features(_vessel(build_year=1990), current_year=2030)
+        assert f["age"] == 40
+
     def test_missing_length(self):
         v = _vessel(length_m=None)
         assert price_model._get_features(v) is None
@@ -1,6 +1,7 @@
 """Tests for the token-aware Anthropic API rate limiter."""
 
 import time
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -65,15 +66,13 @@ class TestTokenRateLimiter:
 
 class TestCallAnthropicWithRateLimit:
     def _make_mock_client(self, response=None):
-        client = MagicMock()
+        # Plain attribute fakes; MagicMock is kept for doubles whose calls are asserted
         if response is None:
-            usage = MagicMock()
-            usage.output_tokens = 350
-            response = MagicMock()
-            response.usage = usage
-            response.content = [MagicMock(text='{"result": "ok"}')]
-        client.messages.create.return_value = response
-        return client
+            response = SimpleNamespace(
+                usage=SimpleNamespace(output_tokens=350),
+                content=[SimpleNamespace(text='{"result": "ok"}')],
+            )
+        return SimpleNamespace(messages=SimpleNamespace(create=lambda **kwargs: response))
 
     @patch("rate_limiter._shared_limiter")
     def test_successful_call_records_tokens(self, mock_limiter):
@@ -112,10 +111,7 @@ class TestCallAnthropicWithRateLimit:
         )
 
         # First call raises 429, second succeeds
-        usage = MagicMock()
-        usage.output_tokens = 300
-        success_response = MagicMock()
-        success_response.usage = usage
+        success_response = SimpleNamespace(usage=SimpleNamespace(output_tokens=300))
 
         client = MagicMock()
         client.messages.create.side_effect = [rate_err, success_response]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import threading
 from pathlib import Path
 
 import pytest
@@ -18,8 +19,15 @@ class _FakeResponse:
         self.reason = reason
 
 
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    """Pin the run id and every UTC timestamp to 2026-02-12 12:00."""
+    monkeypatch.setattr(robots_evidence, "_run_id_now", lambda: "20260212T120000Z")
+    monkeypatch.setattr(robots_evidence, "_iso_utc_now", lambda: "2026-02-12T12:00:00Z")
+
+
 def _read_json(path: Path) -> dict:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return json.loads(path.read_bytes())
 
 
 def test_resolve_targets_includes_rensen_api_host():
@@ -28,9 +36,7 @@ def test_resolve_targets_includes_rensen_api_host():
     assert hosts == {"www.rensendriessen.com", "api.rensendriessen.com"}
 
 
-def test_run_capture_creates_manifest_and_chain(monkeypatch, tmp_path):
-    monkeypatch.setattr(robots_evidence, "_run_id_now", lambda: "20260212T120000Z")
-    monkeypatch.setattr(robots_evidence, "_iso_utc_now", lambda: "2026-02-12T12:00:00Z")
+def test_run_capture_creates_manifest_and_chain(frozen_clock, tmp_path):
 
     def fake_get(url, **_kwargs):
         if url == "https://gallemakelaars.nl/robots.txt":
@@ -83,6 +89,9 @@ def test_run_capture_creates_manifest_and_chain(monkeypatch, tmp_path):
 
     checksum_path = bundle_dir / "SHA256SUMS.txt"
     assert checksum_path.exists()
+    for line in checksum_path.read_text(encoding="utf-8").splitlines():
+        digest, rel = line.split("  ", 1)
+        assert digest == robots_evidence._sha256_file(bundle_dir / rel), rel
     assert (tmp_path / "chain" / "latest_manifest_sha256.txt").exists()
     ledger = (tmp_path / "chain" / "ledger.jsonl").read_text(encoding="utf-8").strip().splitlines()
     assert len(ledger) == 1
@@ -155,3 +164,77 @@ def test_chain_links_previous_manifest_hash(monkeypatch, tmp_path):
 
     ledger_lines = (tmp_path / "chain" / "ledger.jsonl").read_text(encoding="utf-8").strip().splitlines()
     assert len(ledger_lines) == 2
+
+
+def test_run_capture_fetches_shared_robots_url_once(frozen_clock, monkeypatch, tmp_path):
+    monkeypatch.setitem(
+        robots_evidence.DEFAULT_TARGETS_BY_SOURCE,
+        "galle_archive",
+        (
+            robots_evidence.RobotsTarget(
+                source_key="galle_archive",
+                host="gallemakelaars.nl",
+                relevant_paths=("/admin",),
+            ),
+        ),
+    )
+    requested: list[str] = []
+
+    def fake_get(url, **_kwargs):
+        requested.append(url)
+        return _FakeResponse(
+            url=url,
+            status_code=200,
+            content=b"User-agent: *\nDisallow: /admin\n",
+            headers={"Content-Type": "text/plain"},
+        )
+
+    exit_code = robots_evidence.run_capture(
+        output_root=tmp_path,
+        sources_raw="galle,galle_archive",
+        timeout_seconds=10,
+        user_agent="TestEvidenceBot/1.0",
+        strict_network_errors=True,
+        signing_key_path=None,
+        tsa_url=None,
+        http_get=fake_get,
+    )
+    assert exit_code == 0
+    assert requested == ["https://gallemakelaars.nl/robots.txt"]
+
+    manifest = _read_json(tmp_path / "20260212T120000Z" / "manifest.json")
+    permissions = {item["source_key"]: item["robots_permissions"] for item in manifest["targets"]}
+    assert permissions == {"galle": {"/scheepsaanbod": True}, "galle_archive": {"/admin": False}}
+
+
+def test_run_capture_fetches_concurrently_in_target_order(frozen_clock, tmp_path):
+    # Every GET waits for the other two, so a serial fetch loop would time out
+    all_in_flight = threading.Barrier(3, timeout=5)
+
+    def fake_get(url, **_kwargs):
+        all_in_flight.wait()
+        return _FakeResponse(
+            url=url,
+            status_code=200,
+            content=b"User-agent: *\nDisallow:\n",
+            headers={"Content-Type": "text/plain"},
+        )
+
+    exit_code = robots_evidence.run_capture(
+        output_root=tmp_path,
+        sources_raw="galle,rensendriessen",
+        timeout_seconds=10,
+        user_agent="TestEvidenceBot/1.0",
+        strict_network_errors=True,
+        signing_key_path=None,
+        tsa_url=None,
+        http_get=fake_get,
+    )
+    assert exit_code == 0
+
+    manifest = _read_json(tmp_path / "20260212T120000Z" / "manifest.json")
+    assert [item["host"] for item in manifest["targets"]] == [
+        "gallemakelaars.nl",
+        "www.rensendriessen.com",
+        "api.rensendriessen.com",
+    ]
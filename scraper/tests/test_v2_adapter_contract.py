@@ -20,23 +20,36 @@ from v2.sources.pcshipbrokers_v2 import PCShipbrokersAdapter
 from v2.sources.rensendriessen_v2 import RensenDriessenAdapter
 
 
+# (source, fetch function each adapter calls, adapter)
+_ADAPTERS = (
+    ("galle", "v2.sources.galle_v2.fetch_with_retry", GalleAdapter),
+    ("rensendriessen", "v2.sources.rensendriessen_v2.fetch_with_retry", RensenDriessenAdapter),
+    ("pcshipbrokers", "v2.sources.pcshipbrokers_v2.fetch_with_retry", PCShipbrokersAdapter),
+    ("gtsschepen", "v2.sources.gtsschepen_v2.fetch_with_retry", GTSSchepenAdapter),
+    ("gsk", "v2.sources.gsk_v2._fetch_with_retry", GSKAdapter),
+)
+_ADAPTER_IDS = tuple(source for source, _, _ in _ADAPTERS)
+
+
+_LISTING_TEMPLATE = {
+    "name": "Test Vessel",
+    "type": "Motorvrachtschip",
+    "length_m": 80.0,
+    "width_m": 9.5,
+    "build_year": 2000,
+    "tonnage": 1200.0,
+    "price": 500000.0,
+    "url": "https://example.com/vessel",
+    "image_url": "https://example.com/vessel.jpg",
+}
+
+
 def _listing(source: str, source_id: str) -> dict:
-    return {
-        "source": source,
-        "source_id": source_id,
-        "name": "Test Vessel",
-        "type": "Motorvrachtschip",
-        "length_m": 80.0,
-        "width_m": 9.5,
-        "build_year": 2000,
-        "tonnage": 1200.0,
-        "price": 500000.0,
-        "url": "https://example.com/vessel",
-        "image_url": "https://example.com/vessel.jpg",
-    }
-
-
-@dataclass
+    # Fresh dict per call: validators require a real dict and adapters may mutate rows
+    return {"source": source, "source_id": source_id, **_LISTING_TEMPLATE}
+
+
+@dataclass(slots=True, frozen=True)
 class _Resp:
     text: str = ""
     payload: dict | list | None = None
@@ -73,86 +86,94 @@ def test_contract_rows_require_required_fields():
 
 
 def test_all_adapters_expose_owner_constant():
-    adapters = [GalleAdapter, RensenDriessenAdapter, PCShipbrokersAdapter, GTSSchepenAdapter, GSKAdapter]
-    for adapter in adapters:
+    for _, _, adapter in _ADAPTERS:
         assert getattr(adapter, "owner", "")
 
 
-def test_galle_adapter_contract(monkeypatch):
-    monkeypatch.setattr("v2.sources.galle_v2.fetch_with_retry", lambda *_args, **_kwargs: _Resp(text="<div class='cat-product-small'></div>"))
-    monkeypatch.setattr("v2.sources.galle_v2.parse_card", lambda _card: _listing("galle", "g1"))
-    monkeypatch.setattr("v2.sources.galle_v2._fetch_detail", lambda _url: {"raw_details": {}, "image_urls": []})
-
-    adapter = GalleAdapter()
-    rows, metrics = adapter.scrape_listing()
-    vessel, detail_metrics = adapter.enrich_detail(rows[0])
-
-    validate_listing_rows("galle", rows)
-    validate_listing_metrics("galle", metrics)
-    validate_detail_metrics("galle", detail_metrics)
-    assert REQUIRED_LISTING_FIELDS.issubset(rows[0].keys())
-    assert vessel["source_id"] == "g1"
-
-
-def test_rensendriessen_adapter_contract(monkeypatch):
-    calls = {"n": 0}
+def _sequenced(*responses):
+    """fetch stand-in returning *responses* in order, then repeating the last one."""
+    remaining = list(responses)
 
     def fake_fetch(*_args, **_kwargs):
-        calls["n"] += 1
-        if calls["n"] == 1:
-            return _Resp(payload=[{"id": 1}])
-        return _Resp(payload=[])
-
-    monkeypatch.setattr("v2.sources.rensendriessen_v2.fetch_with_retry", fake_fetch)
-    monkeypatch.setattr("v2.sources.rensendriessen_v2.parse_vessel", lambda _v: _listing("rensendriessen", "r1"))
-
-    adapter = RensenDriessenAdapter()
-    rows, metrics = adapter.scrape_listing()
-    vessel, detail_metrics = adapter.enrich_detail(rows[0])
-
-    validate_listing_rows("rensendriessen", rows)
-    validate_listing_metrics("rensendriessen", metrics)
-    validate_detail_metrics("rensendriessen", detail_metrics)
-    assert vessel["source_id"] == "r1"
-
-
-def test_pcshipbrokers_adapter_contract(monkeypatch):
-    monkeypatch.setattr("v2.sources.pcshipbrokers_v2.fetch_with_retry", lambda *_args, **_kwargs: _Resp(text="ok"))
-    monkeypatch.setattr("v2.sources.pcshipbrokers_v2._parse_listing", lambda _text: [_listing("pcshipbrokers", "p1")])
-    monkeypatch.setattr("v2.sources.pcshipbrokers_v2._fetch_detail", lambda _url: {"raw_details": {}, "image_urls": []})
-
-    adapter = PCShipbrokersAdapter()
-    rows, metrics = adapter.scrape_listing()
-    vessel, detail_metrics = adapter.enrich_detail(rows[0])
-
-    validate_listing_rows("pcshipbrokers", rows)
-    validate_listing_metrics("pcshipbrokers", metrics)
-    validate_detail_metrics("pcshipbrokers", detail_metrics)
-    assert vessel["source_id"] == "p1"
+        return remaining.pop(0) if len(remaining) > 1 else remaining[0]
+
+    return fake_fetch
+
+
+def _no_detail(_url):
+    return {"raw_details": {}, "image_urls": []}
+
+
+# source -> (source_id, fetch responses, other patches); fetch targets come from _ADAPTERS
+_CONTRACT_INPUTS = {
+    "galle": (
+        "g1",
+        (_Resp(text="<div class='cat-product-small'></div>"),),
+        {
+            "v2.sources.galle_v2.parse_card": lambda _card: _listing("galle", "g1"),
+            "v2.sources.galle_v2._fetch_detail": _no_detail,
+        },
+    ),
+    "rensendriessen": (
+        "r1",
+        (_Resp(payload=[{"id": 1}]), _Resp(payload=[])),
+        {"v2.sources.rensendriessen_v2.parse_vessel": lambda _v: _listing("rensendriessen", "r1")},
+    ),
+    "pcshipbrokers": (
+        "p1",
+        (_Resp(text="ok"),),
+        {
+            "v2.sources.pcshipbrokers_v2._parse_listing": lambda _text: [_listing("pcshipbrokers", "p1")],
+            "v2.sources.pcshipbrokers_v2._fetch_detail": _no_detail,
+        },
+    ),
+    "gtsschepen": (
+        "t1",
+        (_Resp(text="<div class='grid-item'></div>"), _Resp(text="")),
+        {
+            "v2.sources.gtsschepen_v2.MAX_PAGES": 2,
+            "v2.sources.gtsschepen_v2.parse_card": lambda _card: _listing("gtsschepen", "t1"),
+            "v2.sources.gtsschepen_v2._fetch_detail": _no_detail,
+        },
+    ),
+    "gsk": (
+        "k1",
+        (
+            _Resp(payload={"data": {"getVessels": {"totalCount": 1, "vessels": [{"id": "x"}]}}}),
+            _Resp(payload={"data": {"getVessels": {"totalCount": 1, "vessels": []}}}),
+        ),
+        {
+            "v2.sources.gsk_v2.parse_vessel": lambda _v: _listing("gsk", "k1"),
+            "v2.sources.gsk_v2._fetch_detail": lambda _slug: {"foo": "bar"},
+            "v2.sources.gsk_v2.time.sleep": lambda _v: None,
+        },
+    ),
+}
+
+ADAPTER_CONTRACT_CASES = [
+    pytest.param(adapter, source, fetch_target, *_CONTRACT_INPUTS[source], id=source)
+    for source, fetch_target, adapter in _ADAPTERS
+]
 
 
-def test_gtsschepen_adapter_contract(monkeypatch):
-    calls = {"n": 0}
-
-    def fake_fetch(*_args, **_kwargs):
-        calls["n"] += 1
-        if calls["n"] == 1:
-            return _Resp(text="<div class='grid-item'></div>")
-        return _Resp(text="")
-
-    monkeypatch.setattr("v2.sources.gtsschepen_v2.MAX_PAGES", 2)
-    monkeypatch.setattr("v2.sources.gtsschepen_v2.fetch_with_retry", fake_fetch)
-    monkeypatch.setattr("v2.sources.gtsschepen_v2.parse_card", lambda _card: _listing("gtsschepen", "t1"))
-    monkeypatch.setattr("v2.sources.gtsschepen_v2._fetch_detail", lambda _url: {"raw_details": {}, "image_urls": []})
+@pytest.mark.parametrize(
+    ("adapter_cls", "source", "fetch_target", "source_id", "responses", "patches"),
+    ADAPTER_CONTRACT_CASES,
+)
+def test_adapter_contract(monkeypatch, adapter_cls, source, fetch_target, source_id, responses, patches):
+    monkeypatch.setattr(fetch_target, _sequenced(*responses))
+    for target, value in patches.items():
+        monkeypatch.setattr(target, value)
 
-    adapter = GTSSchepenAdapter()
+    adapter = adapter_cls()
     rows, metrics = adapter.scrape_listing()
     vessel, detail_metrics = adapter.enrich_detail(rows[0])
 
-    validate_listing_rows("gtsschepen", rows)
-    validate_listing_metrics("gtsschepen", metrics)
-    validate_detail_metrics("gtsschepen", detail_metrics)
-    assert vessel["source_id"] == "t1"
+    validate_listing_rows(source, rows)
+    validate_listing_metrics(source, metrics)
+    validate_detail_metrics(source, detail_metrics)
+    assert REQUIRED_LISTING_FIELDS.issubset(rows[0].keys())
+    assert vessel["source_id"] == source_id
 
 
 def test_gtsschepen_404_on_trailing_page_stops_without_error(monkeypatch):
@@ -173,39 +194,10 @@ def test_gtsschepen_404_on_trailing_page_stops_without_error(monkeypatch):
     assert metrics["external_requests"] == 2
 
 
-def test_gsk_adapter_contract(monkeypatch):
-    calls = {"n": 0}
-
-    def fake_fetch(*_args, **_kwargs):
-        calls["n"] += 1
-        if calls["n"] == 1:
-            return _Resp(payload={"data": {"getVessels": {"totalCount": 1, "vessels": [{"id": "x"}]}}})
-        return _Resp(payload={"data": {"getVessels": {"totalCount": 1, "vessels": []}}})
-
-    monkeypatch.setattr("v2.sources.gsk_v2._fetch_with_retry", fake_fetch)
-    monkeypatch.setattr("v2.sources.gsk_v2.parse_vessel", lambda _v: _listing("gsk", "k1"))
-    monkeypatch.setattr("v2.sources.gsk_v2._fetch_detail", lambda _slug: {"foo": "bar"})
-    monkeypatch.setattr("v2.sources.gsk_v2.time.sleep", lambda _v: None)
-
-    adapter = GSKAdapter()
-    rows, metrics = adapter.scrape_listing()
-    vessel, detail_metrics = adapter.enrich_detail(rows[0])
-
-    validate_listing_rows("gsk", rows)
-    validate_listing_metrics("gsk", metrics)
-    validate_detail_metrics("gsk", detail_metrics)
-    assert vessel["source_id"] == "k1"
-
-
 @pytest.mark.parametrize(
     ("target", "adapter_cls"),
-    [
-        ("v2.sources.galle_v2.fetch_with_retry", GalleAdapter),
-        ("v2.sources.rensendriessen_v2.fetch_with_retry", RensenDriessenAdapter),
-        ("v2.sources.pcshipbrokers_v2.fetch_with_retry", PCShipbrokersAdapter),
-        ("v2.sources.gtsschepen_v2.fetch_with_retry", GTSSchepenAdapter),
-        ("v2.sources.gsk_v2._fetch_with_retry", GSKAdapter),
-    ],
+    [(target, adapter_cls) for _, target, adapter_cls in _ADAPTERS],
+    ids=_ADAPTER_IDS,
 )
 def test_adapters_fail_fast_on_non_retryable_status(monkeypatch, target, adapter_cls):
     monkeypatch.setattr(target, lambda *_args, **_kwargs: (_ for _ in ()).throw(_http_error(404)))
@@ -67,19 +67,8 @@ def _insert_staging(run_id: str, source: str, source_id: str, payload: dict, is_
 
 
 def _cleanup_source(source: str) -> None:
-    vessels = supabase.table("vessels").select("id").eq("source", source).execute().data or []
-    vessel_ids = [v["id"] for v in vessels]
-
-    if vessel_ids:
-        supabase.table("activity_log").delete().in_("vessel_id", vessel_ids).execute()
-        supabase.table("price_history").delete().in_("vessel_id", vessel_ids).execute()
-
-    supabase.table("vessels").delete().eq("source", source).execute()
-    supabase.table("scrape_diff_events_v2").delete().eq("source", source).execute()
-    supabase.table("scrape_vessel_staging").delete().eq("source", source).execute()
-    supabase.table("scrape_listing_staging").delete().eq("source", source).execute()
-    supabase.table("scrape_runs_v2").delete().eq("source", source).execute()
-    supabase.table("scrape_source_health_v2").delete().eq("source", source).execute()
+    # One transactional RPC (migration 20260212_cleanup_v2_source_integration_rpc)
+    supabase.rpc("cleanup_v2_source", {"p_source": source}).execute()
 
 
 @pytest.fixture
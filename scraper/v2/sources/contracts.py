@@ -18,7 +18,7 @@ class DetailMetrics(TypedDict):
     parse_fail_count: int
 
 
-REQUIRED_LISTING_FIELDS = {
+REQUIRED_LISTING_FIELDS = frozenset({
     "source",
     "source_id",
     "name",
@@ -30,7 +30,9 @@ REQUIRED_LISTING_FIELDS = {
     "price",
     "url",
     "image_url",
-}
+})
+_REQUIRED_LISTING_METRICS = frozenset(ListingMetrics.__annotations__)
+_REQUIRED_DETAIL_METRICS = frozenset(DetailMetrics.__annotations__)
 
 
 def new_listing_metrics() -> ListingMetrics:
@@ -53,7 +55,8 @@ def validate_listing_rows(source: str, rows: list[dict]) -> list[dict]:
     for idx, row in enumerate(rows):
         if not isinstance(row, dict):
             raise ValueError(f"{source} listing row[{idx}] must be dict")
-        missing = REQUIRED_LISTING_FIELDS.difference(row.keys())
+        # difference() takes the dict directly: no keys view, no Python loop
+        missing = REQUIRED_LISTING_FIELDS.difference(row)
         if missing:
             missing_str = ", ".join(sorted(missing))
             raise ValueError(f"{source} listing row[{idx}] missing required fields: {missing_str}")
@@ -63,8 +66,7 @@ def validate_listing_rows(source: str, rows: list[dict]) -> list[dict]:
 
 
 def validate_listing_metrics(source: str, metrics: dict) -> ListingMetrics:
-    required = {"external_requests", "selector_fail_count", "parse_fail_count", "page_coverage_ratio"}
-    missing = required.difference(metrics.keys())
+    missing = _REQUIRED_LISTING_METRICS.difference(metrics)
     if missing:
         missing_str = ", ".join(sorted(missing))
         raise ValueError(f"{source} listing metrics missing keys: {missing_str}")
@@ -82,8 +84,7 @@ def validate_listing_metrics(source: str, metrics: dict) -> ListingMetrics:
 
 
 def validate_detail_metrics(source: str, metrics: dict) -> DetailMetrics:
-    required = {"external_requests", "parse_fail_count"}
-    missing = required.difference(metrics.keys())
+    missing = _REQUIRED_DETAIL_METRICS.difference(metrics)
     if missing:
         missing_str = ", ".join(sorted(missing))
         raise ValueError(f"{source} detail metrics missing keys: {missing_str}")
@@ -0,0 +1,37 @@
+-- One-round-trip cleanup for V2 DB integration tests.
+-- Deletes every row a throwaway integration source left behind, in a single
+-- transaction. Restricted to the it_v2_ prefix used by the integration tests
+-- and to service_role, so it can never be pointed at a real broker source.
+
+CREATE OR REPLACE FUNCTION cleanup_v2_source(p_source TEXT)
+RETURNS VOID
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF p_source IS NULL OR p_source NOT LIKE 'it\_v2\_%' THEN
+        RAISE EXCEPTION 'cleanup_v2_source only accepts integration test sources (it_v2_*), got %', p_source;
+    END IF;
+
+    DELETE FROM activity_log a
+    USING vessels v
+    WHERE a.vessel_id = v.id
+      AND v.source = p_source;
+
+    DELETE FROM price_history p
+    USING vessels v
+    WHERE p.vessel_id = v.id
+      AND v.source = p_source;
+
+    DELETE FROM vessels WHERE source = p_source;
+    DELETE FROM scrape_diff_events_v2 WHERE source = p_source;
+    DELETE FROM scrape_vessel_staging WHERE source = p_source;
+    DELETE FROM scrape_listing_staging WHERE source = p_source;
+    DELETE FROM scrape_runs_v2 WHERE source = p_source;
+    DELETE FROM scrape_source_health_v2 WHERE source = p_source;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION cleanup_v2_source(TEXT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION cleanup_v2_source(TEXT) TO service_role;